@@ -9,7 +9,8 @@ import os
 import shutil
 import subprocess
 import sys
-from typing import Dict, List, Optional
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import pygame
 
@@ -139,14 +140,11 @@ def _sound_path_type(sound_type: str, name: str) -> str:
 
 
 def init() -> None:
-    """Initialise the audio system and preload short‑effect sounds.
-
-    This function loads the background music (as before) **and** pre‑loads any
-    short sound‑effect files that are used throughout the suite. Generic sounds
-    such as ``eat.wav`` and ``crash.wav`` are pre‑loaded globally, while game‑
-    specific effects are pre‑loaded under a sub‑folder named after the game (e.g.
-    ``pong``). Pre‑loading eliminates the I/O latency that would occur on the
-    first call to :func:`play_effect`, ensuring the sound plays instantly.
+    """Initialise the audio system and start the background music.
+
+    Short sound effects are not loaded here; the application entry point calls
+    :func:`start_preload` once the mixer is running so the first call to
+    :func:`play_effect` does not have to wait on disk I/O.
     """
     """Initialise the pygame mixer and start looping background music.
 
@@ -243,18 +241,6 @@ def init() -> None:
             pygame.mixer.music.load(music_path)
             pygame.mixer.music.set_volume(0 if config.MUTE else 1)
             pygame.mixer.music.play()
-        # Pre‑load generic short‑effect sounds used across multiple games.
-        # preload_effects(["eat.wav", "crash.wav"])  # Removed generic preload; snake sounds are loaded via type‑specific path
-        # Pre‑load Pong‑specific short‑effect sounds removed – lazy loading via play_effect will handle them.
-        # preload_effects(
-        #     [
-        #         "pong_hit.wav",
-        #         "pong_wall.wav",
-        #         "pong_score.wav",
-        #         "pong_game_over.wav",
-        #     ],
-        #     sound_type="pong",
-        # )
     except (pygame.error, FileNotFoundError, OSError, Exception):
         return
 
@@ -299,26 +285,40 @@ def toggle_mute() -> None:
 # ---------------------------------------------------------------------------
 
 
+# Cached music directory scan as ``(music_dir, mtime, files)``; rescanned
+# whenever the directory's modification time changes.
+_MUSIC_CACHE: Optional[Tuple[str, float, List[str]]] = None
+
+
 def get_music_files() -> List[str]:
     """Return a list of music file paths from the music directory.
 
     Only files with supported audio extensions (mp3, wav, ogg) that don't contain
-    "sound-effect" in their name are included (to exclude sound effects).
+    "sound-effect" in their name are included (to exclude sound effects). The
+    scan is cached and only repeated when the directory's mtime changes.
     """
+    global _MUSIC_CACHE
     music_dir = _music_dir()
-    if not os.path.isdir(music_dir):
+    try:
+        mtime = os.stat(music_dir).st_mtime
+    except OSError:
         return []
+    cached = _MUSIC_CACHE
+    if cached is not None and cached[0] == music_dir and cached[1] == mtime:
+        return list(cached[2])
     supported_extensions = (".mp3", ".wav", ".ogg")
     files = []
     try:
-        for filename in os.listdir(music_dir):
-            if filename.lower().endswith(supported_extensions):
+        with os.scandir(music_dir) as entries:
+            for entry in entries:
+                name = entry.name.lower()
                 # Filter out sound effect files by filename pattern
-                if "sound-effect" not in filename.lower():
-                    files.append(os.path.join(music_dir, filename))
-    except Exception:
-        pass
-    return files
+                if name.endswith(supported_extensions) and "sound-effect" not in name:
+                    files.append(entry.path)
+    except OSError:
+        return []
+    _MUSIC_CACHE = (music_dir, mtime, files)
+    return list(files)
 
 
 def play_random_music(context: str = "menu") -> None:
@@ -390,6 +390,9 @@ __all__ = [
     "toggle_mute",
     "play_effect",
     "preload_effects",
+    "register_effects",
+    "start_preload",
+    "stop_preload",
     "play_random_music",
     "is_music_playing",
     "stop_music",
@@ -418,6 +421,75 @@ def fade_out_music(duration_ms: int = 1000) -> None:
 # ---------------------------------------------------------------------------
 
 _SOUND_CACHE: Dict[str, "pygame.mixer.Sound"] = {}
+# Guards writes to ``_SOUND_CACHE`` from the background preload thread.
+_SOUND_CACHE_LOCK = threading.Lock()
+
+# Short effects used by each game, keyed by their ``assets/sounds`` sub-folder.
+# Filled by the game modules through :func:`register_effects`.
+_GAME_EFFECTS: Dict[str, Tuple[str, ...]] = {}
+
+# Background preload thread started by :func:`start_preload`, and the flag
+# asking it to stop early.
+_PRELOAD_THREAD: Optional[threading.Thread] = None
+_PRELOAD_STOP = threading.Event()
+
+
+def register_effects(sound_type: str, filenames: Sequence[str]) -> None:
+    """Declare the short effects a game plays from ``assets/sounds/<sound_type>``.
+
+    Games call this at import time so :func:`start_preload` knows what to load.
+    """
+    _GAME_EFFECTS[sound_type] = tuple(filenames)
+
+
+def _cache_key(sound_type: Optional[str], filename: str) -> str:
+    """Return the ``_SOUND_CACHE`` key for a sound.
+
+    Game-specific sounds are namespaced by their sub-folder so identically named
+    files from different games (e.g. ``shoot.wav``) do not share an entry.
+    """
+    return f"{sound_type}/{filename}" if sound_type else filename
+
+
+def _preload_all_sounds() -> None:
+    """Load every registered effect that already exists into ``_SOUND_CACHE``.
+
+    Runs on the preload thread, so it never creates placeholder files; missing
+    effects are left for :func:`play_effect` to handle on the main thread.
+    """
+    for sound_type, filenames in list(_GAME_EFFECTS.items()):
+        if _PRELOAD_STOP.is_set():
+            return
+        _load_effects(filenames, sound_type, create_missing=False)
+
+
+def start_preload() -> None:
+    """Decode the registered game effects on a background thread.
+
+    Does nothing if the mixer is not initialised or a preload is already
+    running. Call :func:`stop_preload` before shutting the mixer down.
+    """
+    global _PRELOAD_THREAD
+    if not pygame.mixer.get_init():
+        return
+    if _PRELOAD_THREAD is not None and _PRELOAD_THREAD.is_alive():
+        return
+    _PRELOAD_STOP.clear()
+    _PRELOAD_THREAD = threading.Thread(
+        target=_preload_all_sounds, name="audio-preload", daemon=True
+    )
+    _PRELOAD_THREAD.start()
+
+
+def stop_preload() -> None:
+    """Stop the background preload thread, if any, and wait for it to exit."""
+    global _PRELOAD_THREAD
+    thread = _PRELOAD_THREAD
+    if thread is None:
+        return
+    _PRELOAD_STOP.set()
+    thread.join()
+    _PRELOAD_THREAD = None
 
 
 def on_music_end() -> None:
@@ -435,6 +507,16 @@ def on_music_end() -> None:
         pass
 
 
+def _copy_placeholder(source: str, target: str) -> None:
+    """Copy *source* to *target* via a temporary file and ``os.replace``.
+
+    A reader (such as the preload thread) never sees a partially copied WAV.
+    """
+    tmp_path = f"{target}.tmp"
+    shutil.copyfile(source, tmp_path)
+    os.replace(tmp_path, target)
+
+
 def ensure_sound(filename: str, placeholder_name: str = "placeholder.wav") -> bool:
     """Ensure a generic sound asset exists under ``assets/sounds``.
 
@@ -455,7 +537,7 @@ def ensure_sound(filename: str, placeholder_name: str = "placeholder.wav") -> bo
     generic_placeholder = _sound_path(placeholder_name)
     if os.path.isfile(generic_placeholder):
         try:
-            shutil.copyfile(generic_placeholder, prefixed_placeholder)
+            _copy_placeholder(generic_placeholder, prefixed_placeholder)
             # Create a work item for the missing asset
             _create_missing_asset_work_item(filename)
             return True
@@ -483,7 +565,7 @@ def ensure_sound_type(
     if os.path.isfile(generic_placeholder):
         os.makedirs(os.path.dirname(prefixed_placeholder), exist_ok=True)
         try:
-            shutil.copyfile(generic_placeholder, prefixed_placeholder)
+            _copy_placeholder(generic_placeholder, prefixed_placeholder)
             # Create a work item for the missing asset in the specific sound type
             _create_missing_asset_work_item(filename, sound_type)
             return True
@@ -500,16 +582,31 @@ def preload_effects(filenames: List[str], sound_type: Optional[str] = None) -> N
     """
     if not pygame.mixer.get_init():
         return
+    _load_effects(filenames, sound_type, create_missing=True)
+
+
+def _load_effects(
+    filenames: Sequence[str], sound_type: Optional[str], create_missing: bool
+) -> None:
+    """Load *filenames* into ``_SOUND_CACHE``; see :func:`preload_effects`.
+
+    With ``create_missing`` false, placeholder files are never copied and
+    only sounds already on disk are loaded.
+    """
     for filename in filenames:
+        if _PRELOAD_STOP.is_set() and not create_missing:
+            return
+        if create_missing:
+            try:
+                if sound_type:
+                    ensure_sound_type(sound_type, filename)
+                else:
+                    ensure_sound(filename)
+            except Exception:
+                pass
         try:
-            if sound_type:
-                ensure_sound_type(sound_type, filename)
-            else:
-                ensure_sound(filename)
-        except Exception:
-            pass
-        try:
-            if filename not in _SOUND_CACHE:
+            key = _cache_key(sound_type, filename)
+            if key not in _SOUND_CACHE:
                 if sound_type:
                     path = _sound_path_type(sound_type, filename)
                     prefixed = _sound_path_type(sound_type, f"placeholder_{filename}")
@@ -520,7 +617,9 @@ def preload_effects(filenames: List[str], sound_type: Optional[str] = None) -> N
                     if os.path.isfile(prefixed):
                         path = prefixed
                 if os.path.isfile(path):
-                    _SOUND_CACHE[filename] = pygame.mixer.Sound(path)
+                    sound = pygame.mixer.Sound(path)
+                    with _SOUND_CACHE_LOCK:
+                        _SOUND_CACHE.setdefault(key, sound)
         except Exception:
             pass
 
@@ -552,6 +651,14 @@ def play_effect(
             return
     except Exception:
         return
+    key = _cache_key(sound_type, filename)
+    sound = _SOUND_CACHE.get(key)
+    if sound is not None:
+        try:
+            sound.play()
+        except Exception:
+            pass
+        return
     if sound_type:
         ensure_sound_type(sound_type, filename)
         path = _sound_path_type(sound_type, filename)
@@ -566,9 +673,9 @@ def play_effect(
         else:
             return
     try:
-        if filename not in _SOUND_CACHE:
-            _SOUND_CACHE[filename] = pygame.mixer.Sound(path)
-        sound = _SOUND_CACHE[filename]
+        sound = pygame.mixer.Sound(path)
+        with _SOUND_CACHE_LOCK:
+            sound = _SOUND_CACHE.setdefault(key, sound)
         try:
             sound.play()
         except Exception:
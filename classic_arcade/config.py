@@ -110,13 +110,25 @@ def set_difficulty(game_key: str, level: str) -> None:
         TETRIS_DIFFICULTY = level
     else:
         raise ValueError(f"Unknown game key: {game_key}")
-    # Persist the change
-    save_settings()
+    # Persist the change once the player stops cycling through levels
+    _schedule_save()
 
 
 # Settings persistence for mute flag and difficulty settings
-import json
+import atexit
 import os
+import threading
+import time
+
+from classic_arcade import jsonio
+
+# Delay (seconds) used to coalesce bursts of settings changes into one write.
+_SAVE_DELAY = 0.5
+_save_timer: threading.Timer | None = None
+_save_lock = threading.Lock()
+_write_lock = threading.Lock()
+# ``time.monotonic()`` of the last completed write, used to rate limit saves.
+_last_save: float | None = None
 
 _SETTINGS_PATH = os.path.abspath(
     os.path.join(os.path.dirname(__file__), "..", "settings.json")
@@ -131,8 +143,8 @@ def _load_settings() -> None:
     """Load settings from ``settings.json`` if it exists."""
     if os.path.isfile(_SETTINGS_PATH):
         try:
-            with open(_SETTINGS_PATH, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(_SETTINGS_PATH, "rb") as f:
+                data = jsonio.loads(f.read())
                 # Only accept the canonical lowercase "mute" key when loading.
                 # Legacy uppercase "MUTE" is no longer supported to keep the
                 # settings file format consistent and predictable.
@@ -180,8 +192,28 @@ def _load_settings() -> None:
             pass
 
 
-def save_settings() -> None:
-    """Save current settings to ``settings.json``."""
+def save_settings(force: bool = False) -> None:
+    """Save current settings to ``settings.json``.
+
+    Writes are rate limited: unless ``force`` is true, a call made within
+    ``_SAVE_DELAY`` seconds of the previous write is deferred to the debounce
+    timer, so rapid toggles cost a single write. Use :func:`flush_settings` to
+    write a deferred change immediately.
+    """
+    if (
+        not force
+        and _last_save is not None
+        and time.monotonic() - _last_save < _SAVE_DELAY
+    ):
+        _schedule_save()
+        return
+    _cancel_pending_save()
+    _write_settings()
+
+
+def _write_settings() -> None:
+    """Write the current settings to ``settings.json``."""
+    global _last_save
     data = {
         "mute": MUTE,
         "enable_music": ENABLE_MUSIC,
@@ -192,11 +224,60 @@ def save_settings() -> None:
         "space_invaders_difficulty": SPACE_INVADERS_DIFFICULTY,
         "tetris_difficulty": TETRIS_DIFFICULTY,
     }
-    try:
-        with open(_SETTINGS_PATH, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
-    except Exception:
-        pass
+    with _write_lock:
+        try:
+            jsonio.atomic_write_bytes(_SETTINGS_PATH, jsonio.dumps(data))
+        except Exception:
+            pass
+        _last_save = time.monotonic()
+
+
+def _schedule_save() -> None:
+    """(Re)start the timer that writes settings after ``_SAVE_DELAY`` seconds."""
+    global _save_timer
+    with _save_lock:
+        if _save_timer is not None:
+            _save_timer.cancel()
+        timer = threading.Timer(_SAVE_DELAY, _on_save_timer)
+        # The callback needs its own timer to tell whether it was superseded.
+        timer.args = (timer,)
+        timer.daemon = True
+        _save_timer = timer
+        timer.start()
+
+
+def _on_save_timer(timer: threading.Timer) -> None:
+    """Write settings when *timer* fires, unless a newer timer replaced it."""
+    global _save_timer
+    with _save_lock:
+        if _save_timer is not timer:
+            return
+        _save_timer = None
+    _write_settings()
+
+
+def _cancel_pending_save() -> bool:
+    """Cancel the debounce timer; return ``True`` if a write was pending."""
+    global _save_timer
+    with _save_lock:
+        timer, _save_timer = _save_timer, None
+    if timer is None:
+        return False
+    timer.cancel()
+    return True
+
+
+def flush_settings() -> None:
+    """Write any pending settings change to ``settings.json`` immediately.
+
+    Does nothing if no write is pending. Registered with :mod:`atexit` so a
+    change made just before the program exits is not lost.
+    """
+    if _cancel_pending_save():
+        _write_settings()
+
+
+atexit.register(flush_settings)
 
 
 # Load settings on import
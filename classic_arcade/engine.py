@@ -36,16 +36,21 @@ except Exception:
 
 def _pygame_cleanup() -> None:
     """Clean up Pygame resources on interpreter exit."""
+    if audio is not None:
+        audio.stop_preload()
     pygame.quit()
 
 
 atexit.register(_pygame_cleanup)
 import colorsys
 import hashlib
+import importlib
+import importlib.util
 import logging
 import os
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple, Type
+from collections import OrderedDict
+from typing import TYPE_CHECKING, ClassVar, Dict, List, Optional, Tuple, Type
 
 from classic_arcade import config
 from classic_arcade.config import (
@@ -64,7 +69,10 @@ from classic_arcade.config import (
     WHITE,
     YELLOW,
 )
-from classic_arcade.utils import draw_text, wrap_text
+from classic_arcade.utils import draw_text, get_font, wrap_text
+
+if TYPE_CHECKING:
+    from games.game_base import Game
 
 # Path to a shared default icon used when a game does not provide its own.
 # Expected location: <project_root>/assets/icons/default_game_icon.png (or .svg).
@@ -98,6 +106,57 @@ if os.path.isfile(_settings_png):
 elif os.path.isfile(_settings_svg):
     _SETTINGS_ICON_PATH = _settings_svg
 
+# Keys whose KEYDOWN flips a flag (pause, mute); repeats within one frame are
+# collapsed so an event storm cannot toggle (and persist) many times per frame.
+_TOGGLE_KEYS = frozenset((pygame.K_p, pygame.K_m))
+
+
+def _coalesce_toggle_events(
+    events: List[pygame.event.Event],
+) -> List[pygame.event.Event]:
+    """Return *events* with repeated toggle-key presses removed.
+
+    Only the first ``KEYDOWN`` per key in ``_TOGGLE_KEYS`` is kept; all other
+    events pass through in their original order.
+    """
+    seen = set()
+    coalesced = []
+    for event in events:
+        if event.type == pygame.KEYDOWN and event.key in _TOGGLE_KEYS:
+            if event.key in seen:
+                continue
+            seen.add(event.key)
+        coalesced.append(event)
+    return coalesced
+
+
+# Pre-stroked highlight borders keyed by (size, width, color); the menu pulse
+# cycles through a handful of widths, so a small LRU covers every frame.
+_BorderKey = Tuple[Tuple[int, int], int, Tuple[int, ...]]
+_BORDER_CACHE: "OrderedDict[_BorderKey, pygame.Surface]" = OrderedDict()
+_BORDER_CACHE_SIZE = 16
+
+
+def _border_surface(
+    size: Tuple[int, int], width: int, color: Tuple[int, ...]
+) -> pygame.Surface:
+    """Return a transparent surface of *size* with a *width*-pixel border.
+
+    Surfaces are built once and reused; the least recently used entry is
+    dropped once more than ``_BORDER_CACHE_SIZE`` are cached.
+    """
+    key: _BorderKey = (size, width, tuple(color))
+    surf = _BORDER_CACHE.get(key)
+    if surf is not None:
+        _BORDER_CACHE.move_to_end(key)
+        return surf
+    surf = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.rect(surf, color, surf.get_rect(), width=width)
+    _BORDER_CACHE[key] = surf
+    if len(_BORDER_CACHE) > _BORDER_CACHE_SIZE:
+        _BORDER_CACHE.popitem(last=False)
+    return surf
+
 
 def _hue_offset_from_name(name: str) -> float:
     """Deterministically compute a hue offset in the range [0, 1) from a name.
@@ -140,6 +199,10 @@ class State(ABC):
     To request a transition, set ``self.next_state`` to an instance of another ``State``.
     """
 
+    # Subclasses that declare ``__slots__`` get no per-instance ``__dict__``;
+    # those that don't (most games) keep accepting arbitrary attributes.
+    __slots__ = ("next_state",)
+
     def __init__(self) -> None:
         """Initialize the state with no pending transition."""
         self.next_state: Optional["State"] = None
@@ -203,6 +266,14 @@ class Engine:
             pass
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Arcade Suite")
+        # Events are drained once per frame with ``pygame.event.get()``; only
+        # queue the types states react to so bursts of mouse/window events are
+        # dropped by SDL instead of being dispatched one by one.
+        allowed_events = [pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP]
+        if audio is not None and hasattr(audio, "MUSIC_END_EVENT"):
+            allowed_events.append(audio.MUSIC_END_EVENT)
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(allowed_events)
         self.clock = pygame.time.Clock()
         self.running = True
         # Log driver info – warn if using dummy driver (no visible window)
@@ -222,7 +293,7 @@ class Engine:
         """Run the main loop until the user quits or the state signals exit."""
         while self.running:
             dt = self.clock.tick(self.fps) / 1000.0  # seconds
-            for event in pygame.event.get():
+            for event in _coalesce_toggle_events(pygame.event.get()):
                 if event.type == pygame.QUIT:
                     self.running = False
                     break
@@ -253,6 +324,8 @@ class Engine:
                 self.state = new_state
                 if hasattr(self.state, "on_enter"):
                     self.state.on_enter()
+        if audio is not None:
+            audio.stop_preload()
         pygame.quit()
 
 
@@ -315,6 +388,12 @@ class MenuState(State):
         self._launch_message_duration = 3.0  # seconds
         # Flag to track if we\'ve already played music on entry
         self._music_played_on_entry: bool = False
+        # Pre-rendered title, grid and scroll indicator; rebuilt only when the
+        # selection, scroll position or item list changes.
+        self._menu_layer: pygame.Surface | None = None
+        self._menu_layer_key: Tuple[int, float, int, Tuple[int, int]] | None = None
+        # (box_x, box_y, BOX_SIZE) of the selected item, recorded by the layer
+        self._highlight_box: Tuple[int, int, int] | None = None
 
     def handle_event(self, event: pygame.event.Event) -> None:
         """Handle user input events for menu navigation and selection, including scrolling."""
@@ -631,6 +710,7 @@ class MenuState(State):
 
     def _draw_menu_items(self, screen: pygame.Surface) -> None:
         """Draw all menu items in a grid layout with icons and text."""
+        self._highlight_box = None
         num_items = len(self.menu_items)
         if num_items == 0:
             return
@@ -641,7 +721,7 @@ class MenuState(State):
         columns = layout["columns"]
         start_x = layout["start_x"]
         start_y = layout["margin_top"] - self.scroll_offset
-        font = pygame.font.Font(None, self.item_font_size)
+        font = get_font(self.item_font_size)
         for idx, (name, _, icon_path) in enumerate(self.menu_items):
             col = idx % columns
             row = idx // columns
@@ -676,7 +756,8 @@ class MenuState(State):
                 box_x, box_y, BOX_SIZE, icon_surface, text_surface
             )
             if idx == self.selected:
-                self._draw_highlight(screen, box_x, box_y, BOX_SIZE)
+                # Drawn per frame by draw() so the pulse needs no re-render
+                self._highlight_box = (box_x, box_y, BOX_SIZE)
             screen.blit(icon_surface, (icon_x, icon_y))
             screen.blit(text_surface, (text_x, text_y))
 
@@ -751,8 +832,9 @@ class MenuState(State):
         self.highlight_rect = self.highlight_rect.inflate(
             self.highlight_padding * 2, self.highlight_padding * 2
         )
-        pygame.draw.rect(
-            screen, self.highlight_color, self.highlight_rect, width=border_w
+        screen.blit(
+            _border_surface(self.highlight_rect.size, border_w, self.highlight_color),
+            self.highlight_rect.topleft,
         )
 
     def _draw_scroll_indicator(self, screen: pygame.Surface) -> None:
@@ -793,11 +875,26 @@ class MenuState(State):
         """Render the menu title and list of menu items onto the screen.
 
         The selected menu item is highlighted with a pulsing rectangle outline.
+        Only the highlight, mute status and launch message change every frame;
+        everything else is blitted from a cached layer.
         """
-        self._draw_title(screen)
+        key = (
+            self.selected,
+            self.scroll_offset,
+            len(self.menu_items),
+            screen.get_size(),
+        )
+        if self._menu_layer is None or key != self._menu_layer_key:
+            layer = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
+            self._draw_title(layer)
+            self._draw_menu_items(layer)
+            self._draw_scroll_indicator(layer)
+            self._menu_layer = layer
+            self._menu_layer_key = key
+        screen.blit(self._menu_layer, (0, 0))
+        if self._highlight_box is not None:
+            self._draw_highlight(screen, *self._highlight_box)
         self._draw_mute_status(screen)
-        self._draw_menu_items(screen)
-        self._draw_scroll_indicator(screen)
         self._draw_launch_message(screen)
 
         """Handle auto-repeat of held navigation keys during update."""
@@ -877,6 +974,30 @@ class HelpState(State):
     by parsing the Controls section from each game's module docstring.
     """
 
+    # Controls per ``game_class`` (``None`` = all games); the game set is static.
+    _controls_cache: ClassVar[
+        Dict[Optional[Type[State]], List[Tuple[str, List[str]]]]
+    ] = {}
+    # Pre-rendered sections per ``game_class`` as ``(top, surface, advance)``:
+    # the surface is blitted at ``y + top`` and the next section starts at
+    # ``y + advance``.
+    _sections_cache: ClassVar[
+        Dict[Optional[Type[State]], List[Tuple[int, pygame.Surface, int]]]
+    ] = {}
+
+    __slots__ = (
+        "title_font_size",
+        "game_class",
+        "item_font_size",
+        "section_font_size",
+        "margin_top",
+        "line_spacing",
+        "section_spacing",
+        "scroll_offset",
+        "scroll_speed",
+        "_parent_game",
+    )
+
     def __init__(self, game_class: Optional[Type[State]] = None) -> None:
         """Initialize the help screen with title and item font sizes.
 
@@ -893,6 +1014,8 @@ class HelpState(State):
         self.section_spacing = 40
         self.scroll_offset = 0
         self.scroll_speed = 40
+        # Game to resume when opened from a paused game (set by ``Game``)
+        self._parent_game: Optional["Game"] = None
 
     def handle_event(self, event: pygame.event.Event) -> None:
         """Process key events for the help screen.
@@ -905,7 +1028,7 @@ class HelpState(State):
             if event.key in (pygame.K_h, pygame.K_ESCAPE):
                 if self.game_class:
                     # Return to the game that opened help
-                    if hasattr(self, "_parent_game") and self._parent_game:
+                    if self._parent_game is not None:
                         game_instance = self._parent_game
                         game_instance.paused = False  # Resume the game
                         game_instance.next_state = None  # Clear any pending transition
@@ -939,7 +1062,7 @@ class HelpState(State):
             y += self.section_spacing
             for line in control_lines:
                 wrapped_lines = wrap_text(
-                    pygame.font.Font(None, self.item_font_size), line, SCREEN_WIDTH - 60
+                    get_font(self.item_font_size), line, SCREEN_WIDTH - 60
                 )
                 y += len(wrapped_lines) * self.item_font_size + self.line_spacing
             y += 10
@@ -964,39 +1087,12 @@ class HelpState(State):
             center=True,
         )
 
-        # Get controls from all games
-        controls = self._get_all_controls()
-
-        # Draw controls for each game
+        # Draw each game's pre-rendered controls section with a single blit
+        sections = self._get_sections()
         y = self.margin_top - self.scroll_offset
-        for game_name, control_lines in controls:
-            # Game name as section header
-            draw_text(
-                screen,
-                game_name,
-                FONT_SIZE_MEDIUM,
-                YELLOW,
-                SCREEN_WIDTH // 2,
-                y,
-                center=True,
-            )
-            y += self.section_spacing
-
-            # Control lines with wrapping
-            for line in control_lines:
-                wrapped_lines = wrap_text(
-                    pygame.font.Font(None, self.item_font_size), line, SCREEN_WIDTH - 60
-                )
-                for surface, _ in wrapped_lines:
-                    surface.set_colorkey((0, 0, 0))
-                    text_rect = surface.get_rect()
-                    text_rect.center = (SCREEN_WIDTH // 2, y)
-                    screen.blit(surface, text_rect)
-                    y += self.item_font_size
-                y += self.line_spacing
-
-            # Add some spacing between sections
-            y += 10
+        for top, surface, advance in sections:
+            screen.blit(surface, (0, y + top))
+            y += advance
 
         # Footer instruction
         if self.game_class:
@@ -1014,7 +1110,7 @@ class HelpState(State):
         )
 
         # Scroll indicator if content overflows
-        total_height = self._calculate_content_height(controls)
+        total_height = self.margin_top + sum(advance for _, _, advance in sections)
         max_offset = max(0, total_height - (SCREEN_HEIGHT - 110))
         if max_offset > 0:
             # Draw scroll indicator
@@ -1029,12 +1125,62 @@ class HelpState(State):
             ]
             pygame.draw.polygon(screen, YELLOW, points)
 
+    def _get_sections(self) -> List[Tuple[int, pygame.Surface, int]]:
+        """Return the cached per-game sections drawn by ``draw``."""
+        cached = HelpState._sections_cache.get(self.game_class)
+        if cached is None:
+            cached = [
+                self._render_section(game_name, control_lines)
+                for game_name, control_lines in self._get_all_controls()
+            ]
+            HelpState._sections_cache[self.game_class] = cached
+        return cached
+
+    def _render_section(
+        self, game_name: str, control_lines: List[str]
+    ) -> Tuple[int, pygame.Surface, int]:
+        """Render one game's header and wrapped control lines into a surface.
+
+        Layout matches the original per-line drawing: the header is centred
+        on the section origin and each wrapped line is centred on its own row.
+        """
+        header = get_font(FONT_SIZE_MEDIUM).render(game_name, True, YELLOW)
+        placed = [(header, -(header.get_height() // 2))]
+        y = self.section_spacing
+        for line in control_lines:
+            wrapped_lines = wrap_text(
+                get_font(self.item_font_size), line, SCREEN_WIDTH - 60
+            )
+            for surface, _ in wrapped_lines:
+                placed.append((surface, y - surface.get_height() // 2))
+                y += self.item_font_size
+            y += self.line_spacing
+        # Add some spacing between sections
+        advance = y + 10
+
+        top = min(offset for _, offset in placed)
+        bottom = max(offset + surf.get_height() for surf, offset in placed)
+        section = pygame.Surface((SCREEN_WIDTH, bottom - top), pygame.SRCALPHA)
+        for surf, offset in placed:
+            x = SCREEN_WIDTH // 2 - surf.get_width() // 2
+            section.blit(surf, (x, offset - top))
+        return top, section, advance
+
     def _get_all_controls(self) -> List[Tuple[str, List[str]]]:
         """Collect controls from all discovered games, or from a specific game if game_class is set.
 
         Returns a list of (game_name, control_lines) tuples where control_lines
-        is a list of strings describing the controls for that game.
+        is a list of strings describing the controls for that game. The result
+        is built once per ``game_class`` and cached on the class.
         """
+        cached = HelpState._controls_cache.get(self.game_class)
+        if cached is None:
+            cached = self._build_all_controls()
+            HelpState._controls_cache[self.game_class] = cached
+        return cached
+
+    def _build_all_controls(self) -> List[Tuple[str, List[str]]]:
+        """Build the list returned by ``_get_all_controls`` (uncached)."""
         if self.game_class:
             # Get controls for the specific game
             game_name = self.game_class.__name__.replace("State", "")
@@ -1043,7 +1189,7 @@ class HelpState(State):
                 return [(game_name, game_controls)]
             return []
 
-        from menu_items import discover_games
+        from classic_arcade.menu_items import discover_games
 
         items = discover_games()
         controls: List[Tuple[str, List[str]]] = []
@@ -1107,51 +1253,24 @@ class HelpState(State):
         if not launch_target or not hasattr(launch_target, "__module__"):
             return None
 
-        try:
-            # Import the module
-            module_name = launch_target.__module__
-            module = __import__(module_name)
-
-            # Check module docstring for Controls
-            doc = getattr(module, "__doc__", None)
-            if doc:
-                controls = self._parse_controls_from_doc(doc)
-                if controls:
-                    return controls
-
-            # If controls not found, try common submodule patterns
-            # For packages like games.breakout, try games.breakout.breakout
-            try:
-                import importlib
-
-                # Try submodule with same name as package
-                submodule_name = f"{module_name}.{module_name.split('.')[-1]}"
-                submodule = importlib.import_module(submodule_name)
-                doc = getattr(submodule, "__doc__", None)
-                if doc:
-                    controls = self._parse_controls_from_doc(doc)
-                    if controls:
-                        return controls
-            except Exception:
-                pass
-
-            # Try games.game_name.game_name pattern
+        # The launch target's module (e.g. ``games.breakout``) is already
+        # imported by discovery; its docstring is checked first, then the
+        # conventional ``games.<name>.<name>`` implementation module. Only
+        # candidates that actually exist are imported.
+        module_name = launch_target.__module__
+        base = module_name.split(".")[-1]
+        for candidate in dict.fromkeys((module_name, f"games.{base}.{base}")):
             try:
-                import importlib
-
-                game_base = module_name.split(".")[-1]
-                submodule_name = f"games.{game_base}.{game_base}"
-                submodule = importlib.import_module(submodule_name)
-                doc = getattr(submodule, "__doc__", None)
-                if doc:
-                    controls = self._parse_controls_from_doc(doc)
-                    if controls:
-                        return controls
+                module = sys.modules.get(candidate)
+                if module is None:
+                    if importlib.util.find_spec(candidate) is None:
+                        continue
+                    module = importlib.import_module(candidate)
             except Exception:
-                pass
-
-        except Exception:
-            pass
+                continue
+            controls = self._parse_controls_from_doc(getattr(module, "__doc__", None))
+            if controls:
+                return controls
 
         return None
 
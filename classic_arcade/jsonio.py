@@ -0,0 +1,62 @@
+"""JSON and file-write helpers shared by the settings and high score stores.
+
+Uses ``orjson`` when it is installed (``pip install classic-arcade[fast]``)
+and falls back to the standard library ``json`` module otherwise.
+"""
+
+import json
+import os
+from types import ModuleType
+from typing import Any, Optional, cast
+
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the standard library codec.
+    orjson = None
+
+
+def loads(data: bytes) -> Any:
+    """Parse a UTF-8 JSON document.
+
+    Both parsers raise ``ValueError`` subclasses on malformed input.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: object) -> bytes:
+    """Serialise *obj* to indented UTF-8 JSON."""
+    if orjson is not None:
+        return cast(bytes, orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def atomic_write_bytes(path: str, data: bytes) -> None:
+    """Replace *path* with *data* via ``<path>.tmp`` and ``os.replace``.
+
+    The bytes go out through unbuffered ``os.write`` calls, so readers see
+    either the old file or the complete new one. The temporary file is
+    removed if the write or the rename fails.
+    """
+    tmp_path = f"{path}.tmp"
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(tmp_path, flags, 0o644)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+__all__ = ["atomic_write_bytes", "dumps", "loads"]
@@ -4,10 +4,29 @@ Provides a loading screen with a menu to select one of the classic arcade games.
 Implemented using the new ``Engine`` and ``MenuState`` for a unified state machine.
 """
 
-from classic_arcade import audio
-from classic_arcade.engine import Engine, MenuState
-from classic_arcade.menu_items import get_menu_items
-from games.splash import SplashState
+import importlib
+from typing import Any
+
+# Heavy subsystems (pygame, the engine, game discovery) are imported inside
+# ``main()`` so ``--help`` and a headless exit stay fast.  The names remain
+# reachable as module attributes through ``__getattr__`` for compatibility.
+_LAZY_ATTRS = {
+    "audio": ("classic_arcade.audio", None),
+    "Engine": ("classic_arcade.engine", "Engine"),
+    "MenuState": ("classic_arcade.engine", "MenuState"),
+    "get_menu_items": ("classic_arcade.menu_items", "get_menu_items"),
+    "SplashState": ("games.splash", "SplashState"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the lazily imported names listed in ``_LAZY_ATTRS``."""
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(module_name)
+    return module if attr is None else getattr(module, attr)
 
 
 def main() -> None:
@@ -70,13 +89,9 @@ def main() -> None:
             "Running frozen executable (onefile bootloader unpack time not logged)"
         )
     logger.debug("Screen size: %dx%d", SCREEN_WIDTH, SCREEN_HEIGHT)
-    logger.debug("Available games:")
-    for name, _, _ in get_menu_items():
-        logger.debug(" - %s", name)
 
     # Ensure pygame quits cleanly on unexpected exit
     import atexit
-    import os
 
     import pygame
 
@@ -95,13 +110,24 @@ def main() -> None:
         logger.info("No DISPLAY detected – exiting without launching the graphical UI.")
         return
 
+    from classic_arcade import audio
+    from classic_arcade.engine import Engine
+    from classic_arcade.menu_items import get_menu_items
+    from games.splash import SplashState
+
+    log_step("modules imported")
     menu_items = get_menu_items()
+    logger.debug("Available games:")
+    for name, _, _ in menu_items:
+        logger.debug(" - %s", name)
     log_step("menu discovery complete")
 
     initial_state = SplashState()
     engine = Engine(initial_state)
     log_step("engine initialized")
     audio.init()
+    # Game modules registered their effects during menu discovery above.
+    audio.start_preload()
     log_step("audio initialized")
     engine.run()
 
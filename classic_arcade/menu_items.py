@@ -6,16 +6,48 @@ state when the user selects an entry.
 """
 
 import importlib
+import importlib.machinery
+import importlib.util
 import inspect
 import logging
 import os
 import pkgutil
+import re
 from typing import Callable, List, Tuple, Type, Union
 
 from classic_arcade.engine import State
 
 logger = logging.getLogger(__name__)
 
+# Built-in game packages that are always imported during discovery, and the
+# explicit fallback list used when discovery finds nothing.
+_KNOWN_GAMES = (
+    "games.breakout",
+    "games.pong",
+    "games.snake",
+    "games.tetris",
+    "games.space_invaders",
+)
+
+# Top-level ``STATE_CLASS = ...`` assignment marking a module as a game.
+_STATE_CLASS_RE = re.compile(rb"^STATE_CLASS\s*=", re.MULTILINE)
+
+
+def _declares_state_class(spec: importlib.machinery.ModuleSpec) -> bool:
+    """Return ``True`` if the module source behind ``spec`` assigns ``STATE_CLASS``.
+
+    The source is scanned as text so candidates can be rejected without
+    executing their module-level code.
+    """
+    origin = spec.origin
+    if not origin or not spec.has_location:
+        return False
+    try:
+        with open(origin, "rb") as fh:
+            return _STATE_CLASS_RE.search(fh.read()) is not None
+    except OSError:
+        return False
+
 
 def _is_mode_specific_state(state_cls: Type) -> bool:
     """Check if a state class is mode-specific and should be excluded from menu entries.
@@ -58,11 +90,14 @@ def _friendly_name_from_module(module_name: str, cls_name: str | None = None) ->
 def discover_games() -> List[Tuple[str, object, str | None]]:
     """Dynamically discover game modules in the `games` package.
 
-    Scans `games` for submodules, imports each one and looks for either:
+    Scans `games` for submodules using ``importlib.util.find_spec`` and only
+    imports those that are known built-in games or whose source declares a
+    ``STATE_CLASS`` marker, so unrelated modules never run their module-level
+    code. Each imported module is inspected for:
     - a callable ``run`` function (preferred for launching)
-    - or a concrete subclass of ``engine.State`` (fallback, but will be disabled if ``run`` is missing).
-
-    Packages that define neither are still added as disabled entries.
+    - the ``STATE_CLASS`` marker, or otherwise a concrete subclass of
+      ``engine.State`` found in the module or its submodules (used for the
+      display name; the entry is disabled if ``run`` is missing).
 
     Returns a list of ``(display_name, launch_target, icon_path)`` tuples where
     ``launch_target`` is a callable ``run`` function if available, otherwise ``None``
@@ -93,16 +128,32 @@ def discover_games() -> List[Tuple[str, object, str | None]]:
         if name in excluded or name.startswith("._"):
             continue
         full_name = f"games.{name}"
+        try:
+            spec = importlib.util.find_spec(full_name)
+        except (ImportError, ValueError) as e:
+            logger.debug("Failed to locate %s, skipping", full_name, exc_info=True)
+            continue
+        if spec is None:
+            continue
+        if full_name not in _KNOWN_GAMES and not _declares_state_class(spec):
+            logger.debug("%s does not declare STATE_CLASS, skipping", full_name)
+            continue
         try:
             module = importlib.import_module(full_name)
         except (ImportError, AttributeError) as e:
             logger.debug("Failed to import %s, skipping", full_name, exc_info=True)
             continue
 
+        # A declared STATE_CLASS makes scanning submodules for State subclasses
+        # unnecessary.
+        state_cls = getattr(module, "STATE_CLASS", None)
+        if not (isinstance(state_cls, type) and issubclass(state_cls, State)):
+            state_cls = None
+
         # Collect candidate modules to inspect: the module itself, plus any submodules if
         # the entry is a package (e.g. games.space_invaders.space_invaders).
         candidates = [module]
-        if ispkg:
+        if ispkg and state_cls is None:
             try:
                 for _, subname, _ in pkgutil.iter_modules(module.__path__):
                     try:
@@ -128,8 +179,9 @@ def discover_games() -> List[Tuple[str, object, str | None]]:
                 break
 
         # Determine friendly display name (prefer State subclass name if present)
-        state_cls = None
         for mod in candidates:
+            if state_cls:
+                break
             for _, obj in inspect.getmembers(mod, inspect.isclass):
                 if obj.__module__ != mod.__name__:
                     continue
@@ -140,8 +192,6 @@ def discover_games() -> List[Tuple[str, object, str | None]]:
                             break
                 except (TypeError, AttributeError):
                     continue
-            if state_cls:
-                break
 
         display_name = _friendly_name_from_module(
             name, getattr(state_cls, "__name__", None) if state_cls else None
@@ -180,14 +230,7 @@ def discover_games() -> List[Tuple[str, object, str | None]]:
 
     if not items:
         logger.warning("No games discovered; falling back to explicit import list")
-        fallback_modules = (
-            "games.breakout",
-            "games.pong",
-            "games.snake",
-            "games.tetris",
-            "games.space_invaders",
-        )
-        for full_name in fallback_modules:
+        for full_name in _KNOWN_GAMES:
             try:
                 module = importlib.import_module(full_name)
             except (ImportError, AttributeError) as e:
@@ -269,6 +312,10 @@ def discover_games() -> List[Tuple[str, object, str | None]]:
     return items
 
 
+# ``games.settings.SettingsState``, resolved on the first ``get_menu_items`` call.
+_SETTINGS_STATE: type | None = None
+
+
 def get_menu_items() -> List[Tuple[str, object, str | None]]:
     """Return menu items as ``(name, state_class)`` tuples.
 
@@ -285,9 +332,12 @@ def get_menu_items() -> List[Tuple[str, object, str | None]]:
         logger.info("No games discovered")
 
     # Always ensure Settings is present as the last menu item.
+    global _SETTINGS_STATE
     try:
-        settings_mod = importlib.import_module("games.settings")
-        SettingsState = getattr(settings_mod, "SettingsState")
+        if _SETTINGS_STATE is None:
+            settings_mod = importlib.import_module("games.settings")
+            _SETTINGS_STATE = getattr(settings_mod, "SettingsState")
+        SettingsState = _SETTINGS_STATE
         settings_icon_path = None
         icon_candidate = os.path.join(
             os.path.dirname(os.path.dirname(__file__)),
@@ -4,9 +4,10 @@ Provides screen dimensions, color definitions, and a helper function for drawing
 """
 
 # Added imports for asset path resolution
+import functools
 import os
 import sys
-from typing import List, Tuple
+from typing import Dict, Iterable, List, Tuple
 
 import pygame
 
@@ -46,6 +47,74 @@ def resolve_asset_path(relative_path: str) -> str | None:
     return candidate if os.path.exists(candidate) else None
 
 
+# Default-typeface fonts keyed by point size (see ``get_font``).
+_FONT_CACHE: Dict[int, pygame.font.Font] = {}
+
+
+def get_font(size: int) -> pygame.font.Font:
+    """Return a shared default ``pygame.font.Font`` of the given size.
+
+    Constructing a font parses the typeface every time, so per-frame callers
+    should use this helper instead of ``pygame.font.Font(None, size)``. The
+    cache is emptied on ``pygame.quit()`` because fonts created before a quit
+    are invalid once pygame is re-initialised.
+
+    Args:
+        size: Font size in points.
+
+    Returns:
+        The cached font object.
+    """
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        if not _FONT_CACHE:
+            # Quit callbacks only fire once, so re-register on every refill.
+            pygame.register_quit(_FONT_CACHE.clear)
+        font = _FONT_CACHE[size] = pygame.font.Font(None, size)
+    return font
+
+
+@functools.lru_cache(maxsize=256)
+def _render_cached(text: str, size: int, color: Tuple[int, ...]) -> pygame.Surface:
+    """Render *text* once per ``(text, size, color)``; see ``render_text``."""
+    surface = get_font(size).render(text, True, color)
+    if pygame.display.get_surface() is not None:
+        # Match the display pixel format so repeated blits take SDL's fast path
+        surface = surface.convert_alpha()
+    return surface
+
+
+@functools.lru_cache(maxsize=128)
+def _color_key(color: Tuple[int, ...]) -> Tuple[int, ...]:
+    """Normalise an RGB(A) tuple to RGBA once per distinct tuple."""
+    return tuple(pygame.Color(color))
+
+
+def render_text(text: str, size: int, color: Tuple[int, int, int]) -> pygame.Surface:
+    """Return an antialiased render of *text* in the default typeface.
+
+    Renders are cached, so static labels redrawn every frame cost only a
+    blit. The returned surface is shared between callers and must not be
+    modified; copy it first if it needs to change.
+
+    Args:
+        text: Text to render.
+        size: Font size in points.
+        color: RGB color tuple (or ``pygame.Color``).
+
+    Returns:
+        The rendered text surface.
+    """
+    if isinstance(color, tuple):
+        key = _color_key(color)
+    else:
+        # pygame.Color is mutable and unhashable, so it is converted each time
+        key = tuple(pygame.Color(color))
+    return _render_cached(text, size, key)
+
+
 def wrap_text(
     font: pygame.font.Font,
     text: str,
@@ -117,12 +186,8 @@ def draw_text(
     Returns:
         Total height of rendered text in pixels.
     """
-    if not pygame.font.get_init():
-        pygame.font.init()
-    font = pygame.font.Font(None, size)
-
     if max_width:
-        lines = wrap_text(font, text, max_width, color)
+        lines = wrap_text(get_font(size), text, max_width, color)
         total_height = sum(h for _, h in lines)
 
         if center:
@@ -141,14 +206,47 @@ def draw_text(
 
         return total_height
     else:
-        text_surface = font.render(text, True, color)
+        text_surface = render_text(text, size, color)
         text_rect = text_surface.get_rect()
         if center:
             text_rect.center = (x, y)
         else:
             text_rect.topleft = (x, y)
         surface.blit(text_surface, text_rect)
-        return font.get_height()
+        return get_font(size).get_height()
+
+
+def draw_texts(
+    surface: pygame.Surface,
+    items: Iterable[Tuple[str, int, Tuple[int, int, int], int, int, bool]],
+) -> None:
+    """Draw several single-line labels with one ``Surface.blits`` call.
 
+    Each item is ``(text, size, color, x, y, center)`` with the same meaning
+    as the matching ``draw_text`` arguments. Batching saves one Python-to-SDL
+    round trip per label on screens that draw a group of labels every frame.
 
-__all__ = ["draw_text", "wrap_text", "resolve_asset_path"]
+    Args:
+        surface: Surface to draw on.
+        items: Label descriptions to draw, in order.
+    """
+    blit_sequence = []
+    for text, size, color, x, y, center in items:
+        text_surface = render_text(text, size, color)
+        text_rect = text_surface.get_rect()
+        if center:
+            text_rect.center = (x, y)
+        else:
+            text_rect.topleft = (x, y)
+        blit_sequence.append((text_surface, text_rect))
+    surface.blits(blit_sequence, doreturn=False)
+
+
+__all__ = [
+    "draw_text",
+    "draw_texts",
+    "get_font",
+    "render_text",
+    "wrap_text",
+    "resolve_asset_path",
+]
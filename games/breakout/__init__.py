@@ -9,6 +9,9 @@ from games.run_helper import run_game
 
 from .breakout import BreakoutState
 
+# Primary state class; lets menu discovery identify this package as a game.
+STATE_CLASS = BreakoutState
+
 __all__ = ["BreakoutState", "run"]
 
 
@@ -42,6 +42,10 @@ from games.highscore import draw_highscore_screen, record_highscore
 
 logger = logging.getLogger(__name__)
 
+# Short effects played by this game; preloaded by ``audio.start_preload``.
+SOUND_EFFECTS = ("bounce.wav", "brick.wav")
+audio.register_effects("breakout", SOUND_EFFECTS)
+
 # Game constants
 PADDLE_WIDTH = 100
 PADDLE_HEIGHT = 10
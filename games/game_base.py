@@ -21,7 +21,13 @@ import pygame
 from classic_arcade import audio
 from classic_arcade.config import FONT_SIZE_SMALL, YELLOW
 from classic_arcade.engine import MenuState, State
-from classic_arcade.utils import SCREEN_HEIGHT, SCREEN_WIDTH, WHITE, draw_text
+from classic_arcade.utils import (
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+    WHITE,
+    draw_text,
+    get_font,
+)
 
 # import get_menu_items lazily in handle_event
 
@@ -78,9 +84,9 @@ class Game(State):
 
                 self.paused = True  # Pause the game when help is shown
                 # Store a reference to this instance so it can be restored
-                self._help_parent = self  # type: ignore
+                self._help_parent = self
                 help_state = HelpState(type(self))
-                help_state._parent_game = self  # type: ignore
+                help_state._parent_game = self
                 self.request_transition(help_state)
                 return
             if event.key == pygame.K_p:
@@ -106,7 +112,7 @@ class Game(State):
         overlay.fill((0, 0, 0, 128))  # 50% black
         screen.blit(overlay, (0, 0))
         # Render the "Paused" text
-        font = pygame.font.Font(None, 48)
+        font = get_font(48)
         text_surface = font.render("Paused", True, WHITE)
         text_rect = text_surface.get_rect(
             center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
@@ -146,7 +152,7 @@ class Game(State):
         Shows the remaining time in seconds if countdown is active.
         """
         if self.countdown_active:
-            font = pygame.font.Font(None, 144)
+            font = get_font(144)
             text = f"{int(self.countdown_remaining) + 1}"
             text_surface = font.render(text, True, WHITE)
             text_rect = text_surface.get_rect(
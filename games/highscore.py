@@ -11,21 +11,40 @@ The JSON format is a list of objects::
     [{"score": 123, "timestamp": "2026-02-05T12:34:56.789123"}, ...]
 
 If the file does not exist or is malformed an empty list is returned.
+
+Scores are kept in an in‑memory cache. :func:`add_score` writes the file at
+most once every ``_FLUSH_INTERVAL`` seconds; pending changes are written by
+:func:`_flush_all`, which runs automatically at interpreter exit.
 """
 
-import json
+import atexit
+import bisect
 import logging
 import os
+import time
 from datetime import datetime
-from typing import TYPE_CHECKING, Dict, List, Sequence
+from typing import TYPE_CHECKING, Any, Dict, List, Sequence, Set, Tuple
 
 import pygame
 
+from classic_arcade import jsonio
+
 logger = logging.getLogger(__name__)
 
+
 # Directory for high‑score files – placed next to this module's parent directory (project root).
 _HIGHSCORE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 
+# Minimum number of seconds between batched writes triggered by ``add_score``.
+_FLUSH_INTERVAL = 5.0
+# Score lists keyed by file path, and the paths whose cache is newer than disk.
+_CACHE: Dict[str, List[Dict[str, Any]]] = {}
+_DIRTY: Set[str] = set()
+_LAST_FLUSH: float | None = None
+# Resolved file paths keyed by ``(_HIGHSCORE_DIR, game_name)``, so pointing the
+# module at another directory never returns a stale path.
+_PATHS: Dict[Tuple[str, str], str] = {}
+
 
 def _ensure_dir() -> None:
     """Make sure the directory for high‑score files exists."""
@@ -36,37 +55,85 @@ def _file_path(game_name: str) -> str:
     """Return the absolute path for the high‑score file of *game_name*.
 
     The file is named ``highscore_<game_name>.json`` and lives in the project
-    root directory (one level above ``games/``).
+    root directory (one level above ``games/``). Paths are computed once per
+    game and directory.
     """
-    filename = f"highscore_{game_name.lower()}.json"
-    return os.path.join(_HIGHSCORE_DIR, filename)
+    key = (_HIGHSCORE_DIR, game_name)
+    path = _PATHS.get(key)
+    if path is None:
+        filename = f"highscore_{game_name.lower()}.json"
+        path = _PATHS[key] = os.path.join(_HIGHSCORE_DIR, filename)
+    return path
 
 
 def load_highscores(game_name: str) -> List[Dict]:
     """Load the list of high‑score entries for *game_name*.
 
-    Returns an empty list if the file does not exist or cannot be parsed.
+    Cached entries (including scores not yet flushed) are returned without
+    touching the disk. Returns an empty list if the file does not exist or
+    cannot be parsed.
     """
     path = _file_path(game_name)
-    if not os.path.exists(path):
-        return []
+    cached = _CACHE.get(path)
+    if cached is not None:
+        return list(cached)
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            if isinstance(data, list):
-                return data
-    except (json.JSONDecodeError, UnicodeDecodeError, OSError) as e:
+        # Read the whole file with a single syscall and parse the bytes directly.
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            raw = os.read(fd, os.fstat(fd).st_size)
+        finally:
+            os.close(fd)
+        data = jsonio.loads(raw)
+    except FileNotFoundError:
+        return []
+    except (ValueError, OSError) as e:
         logger.warning("Failed to load high scores for '%s': %s", game_name, e)
         return []
+    if isinstance(data, list):
+        _CACHE[path] = data
+        return list(data)
     return []
 
 
+def _write(path: str, scores: List[Dict[str, Any]]) -> None:
+    """Write *scores* to *path* as JSON."""
+    _ensure_dir()
+    jsonio.atomic_write_bytes(path, jsonio.dumps(scores))
+
+
 def save_highscores(game_name: str, scores: List[Dict]) -> None:
     """Write *scores* (a list of ``{"score": int, "timestamp": str}`` entries) to the JSON file."""
-    _ensure_dir()
     path = _file_path(game_name)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(scores, f, indent=2)
+    _write(path, scores)
+    _CACHE[path] = list(scores)
+    _DIRTY.discard(path)
+
+
+def _flush(path: str) -> None:
+    """Write the cached scores for *path* to disk if they changed."""
+    global _LAST_FLUSH
+    if path in _DIRTY:
+        _write(path, _CACHE[path])
+        _DIRTY.discard(path)
+    _LAST_FLUSH = time.monotonic()
+
+
+def _flush_all() -> None:
+    """Write every pending high‑score change to disk."""
+    for path in list(_DIRTY):
+        try:
+            _flush(path)
+        except OSError as e:
+            logger.warning("Failed to save high scores to '%s': %s", path, e)
+
+
+atexit.register(_flush_all)
+
+
+def _descending_score(entry: Dict[str, Any]) -> int:
+    """Sort key that orders score entries from highest to lowest."""
+    return -int(entry["score"])
 
 
 def add_score(game_name: str, score: int) -> List[Dict]:
@@ -74,15 +141,20 @@ def add_score(game_name: str, score: int) -> List[Dict]:
 
     The function returns the full list of entries sorted by score in
     descending order.  New entries are timestamped with the current ISO‑8601
-    datetime.
+    datetime. The file is rewritten at most once every ``_FLUSH_INTERVAL``
+    seconds; later changes are written by the next flush or at exit.
     """
     scores = load_highscores(game_name)
     entry = {"score": int(score), "timestamp": datetime.now().isoformat()}
-    scores.append(entry)
-    # Sort descending by score.
-    scores.sort(key=lambda e: e["score"], reverse=True)
-    save_highscores(game_name, scores)
-    return scores
+    # Lists are kept sorted descending by score, so insert in place rather
+    # than re-sorting; ties land after existing entries, as a stable sort would.
+    bisect.insort(scores, entry, key=_descending_score)
+    path = _file_path(game_name)
+    _CACHE[path] = scores
+    _DIRTY.add(path)
+    if _LAST_FLUSH is None or time.monotonic() - _LAST_FLUSH > _FLUSH_INTERVAL:
+        _flush(path)
+    return list(scores)
 
 
 def record_highscore(state: object, game_name: str, score: int) -> List[Dict]:
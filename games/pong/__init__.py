@@ -14,6 +14,9 @@ from .pong import (
     PongState,
 )
 
+# Primary state class; lets menu discovery identify this package as a game.
+STATE_CLASS = PongState
+
 __all__ = [
     "PongState",
     "PongSinglePlayerState",
@@ -32,7 +32,7 @@ from classic_arcade.config import (
 from classic_arcade.constants import COUNTDOWN_SECONDS
 from classic_arcade.difficulty import apply_difficulty_multiplier
 from classic_arcade.engine import State
-from classic_arcade.utils import draw_text
+from classic_arcade.utils import draw_text, draw_texts
 from games.game_base import Game
 from games.highscore import draw_highscore_screen, record_highscore
 
@@ -281,23 +281,26 @@ class PongState(Game):
         pygame.draw.rect(screen, WHITE, self.left_paddle)
         pygame.draw.rect(screen, WHITE, self.right_paddle)
         pygame.draw.ellipse(screen, GREEN, self.ball)
-        draw_text(
+        draw_texts(
             screen,
-            f"{self.left_score}",
-            FONT_SIZE_MEDIUM,
-            WHITE,
-            SCREEN_WIDTH // 4,
-            30,
-            center=True,
-        )
-        draw_text(
-            screen,
-            f"{self.right_score}",
-            FONT_SIZE_MEDIUM,
-            WHITE,
-            SCREEN_WIDTH * 3 // 4,
-            30,
-            center=True,
+            (
+                (
+                    f"{self.left_score}",
+                    FONT_SIZE_MEDIUM,
+                    WHITE,
+                    SCREEN_WIDTH // 4,
+                    30,
+                    True,
+                ),
+                (
+                    f"{self.right_score}",
+                    FONT_SIZE_MEDIUM,
+                    WHITE,
+                    SCREEN_WIDTH * 3 // 4,
+                    30,
+                    True,
+                ),
+            ),
         )
         if self.game_over:
             record_highscore(self, "pong", max(self.left_score, self.right_score))
@@ -404,33 +407,30 @@ class PongModeSelectState(State):
         """Render mode selection screen."""
         screen.fill(BLACK)
 
-        # Draw title
-        draw_text(
-            screen,
-            "Select Pong Mode",
-            self.title_font_size,
-            WHITE,
-            SCREEN_WIDTH // 2,
-            SCREEN_HEIGHT // 3,
-            center=True,
-        )
-
-        # Draw options
-        for i, option in enumerate(self.options):
-            if i == self.selected:
-                text_color = GREEN
-            else:
-                text_color = WHITE
-
-            draw_text(
-                screen,
-                option,
-                self.item_font_size,
-                text_color,
+        # Title followed by the options, drawn in a single batch
+        labels = [
+            (
+                "Select Pong Mode",
+                self.title_font_size,
+                WHITE,
                 SCREEN_WIDTH // 2,
-                SCREEN_HEIGHT // 2 + i * 50,
-                center=True,
+                SCREEN_HEIGHT // 3,
+                True,
+            )
+        ]
+        for i, option in enumerate(self.options):
+            text_color = GREEN if i == self.selected else WHITE
+            labels.append(
+                (
+                    option,
+                    self.item_font_size,
+                    text_color,
+                    SCREEN_WIDTH // 2,
+                    SCREEN_HEIGHT // 2 + i * 50,
+                    True,
+                )
             )
+        draw_texts(screen, labels)
 
 
 def run() -> None:
@@ -27,6 +27,7 @@ from classic_arcade.utils import (
     WHITE,
     YELLOW,
     draw_text,
+    get_font,
 )
 from games.game_base import Game
 
@@ -174,7 +175,7 @@ class SettingsState(Game):
         )
         # List of games
         start_y = SCREEN_HEIGHT // 4
-        font = pygame.font.Font(None, self.item_font_size)
+        font = get_font(self.item_font_size)
         for idx, (key, name) in enumerate(self._games):
             diff = self._get_difficulty(key).capitalize()
             line = f"{name}: {diff}"
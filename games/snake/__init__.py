@@ -17,6 +17,9 @@ from .snake import (
     get_snake_speed,
 )
 
+# Primary state class; lets menu discovery identify this package as a game.
+STATE_CLASS = SnakeState
+
 __all__ = ["SnakeState", "Snake2PlayerState", "SnakeModeSelectState", "run"]
 
 
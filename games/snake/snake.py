@@ -8,7 +8,7 @@ Controls:
 """
 
 import logging
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import pygame
 
@@ -50,6 +50,14 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Short effects played by this game; preloaded by ``audio.start_preload``.
+SOUND_EFFECTS = ("eat.wav", "crash.wav", "shrink.wav")
+audio.register_effects("snake", SOUND_EFFECTS)
+
+# Heart-glyph font lookups keyed by size (``None`` when no font has the glyph).
+# The system font search is slow, so it runs once; emptied on ``pygame.quit()``.
+_HEART_FONTS: Dict[int, Optional[pygame.font.Font]] = {}
+
 # Game constants
 BLOCK_SIZE = 20
 BASE_SNAKE_SPEED = 10  # frames per second (base)
@@ -433,8 +441,17 @@ class SnakeState(Game):
         else:
             self._draw_heart_circles(screen, hearts)
 
-    def _find_heart_font(self, sz: int):
+    def _find_heart_font(self, sz: int) -> Optional[pygame.font.Font]:
         """Find a font that supports the heart glyph, or None if not available."""
+        if sz in _HEART_FONTS:
+            return _HEART_FONTS[sz]
+        if not _HEART_FONTS:
+            pygame.register_quit(_HEART_FONTS.clear)
+        font = _HEART_FONTS[sz] = self._search_heart_font(sz)
+        return font
+
+    def _search_heart_font(self, sz: int) -> Optional[pygame.font.Font]:
+        """Search system fonts for one that supports the heart glyph."""
         candidates = [
             "DejaVu Sans",
             "Segoe UI Symbol",
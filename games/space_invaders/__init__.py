@@ -22,6 +22,9 @@ from .space_invaders import (
     SpaceInvadersState,
 )
 
+# Primary state class; lets menu discovery identify this package as a game.
+STATE_CLASS = SpaceInvadersState
+
 __all__ = [
     "SpaceInvadersState",
     "run",
@@ -11,7 +11,7 @@ Controls:
 import logging
 import random
 from datetime import datetime
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import pygame
 
@@ -44,6 +44,17 @@ from games.highscore import draw_highscore_screen, record_highscore
 
 logger = logging.getLogger(__name__)
 
+# Short effects played by this game; preloaded by ``audio.start_preload``.
+SOUND_EFFECTS = (
+    "shoot.wav",
+    "enemy_shoot.wav",
+    "alien_hit.wav",
+    "cover.wav",
+    "player_hit.wav",
+    "game_over.wav",
+)
+audio.register_effects("space_invaders", SOUND_EFFECTS)
+
 # Game constants
 PLAYER_WIDTH = 50
 PLAYER_HEIGHT = 30
@@ -64,6 +75,8 @@ ALIEN_H_SPACING = 10
 ALIEN_V_SPACING = 10
 ALIEN_SPEED = 1  # horizontal speed per frame
 ALIEN_DESCEND = 20
+# Shared palette; every alien references one of these tuples
+ALIEN_COLORS = (RED, GREEN, BLUE, YELLOW)
 FONT_SIZE = 24
 
 # Configurable constants
@@ -167,23 +180,29 @@ class SpaceInvadersState(Game):
         if is_pressed(KEY_RIGHT) and self.player.right < SCREEN_WIDTH:
             self.player.move_ip(PLAYER_SPEED, 0)
         # Move player bullets (pre-shelter collision check)
-        # First, handle bullet hitting shelter blocks before moving
-        for bullet in self.bullets[:]:
-            shelter_hit = bullet.collidelist(self.shelters)
+        # First, handle bullet hitting shelter blocks before moving. Survivors
+        # are collected and written back in place rather than removed one by
+        # one, which would rescan the list for every hit.
+        # Shelter blocks only disappear during the frame, so one bounding box
+        # taken now stays a safe broadphase for every shelter test below.
+        shelter_bounds = _bounds(self.shelters)
+        remaining = []
+        for bullet in self.bullets:
+            shelter_hit = _first_hit(bullet, self.shelters, shelter_bounds)
             if shelter_hit != -1:
                 self.shelters.pop(shelter_hit)
-                self.bullets.remove(bullet)
                 continue
-        # Now move remaining player bullets
-        for bullet in self.bullets[:]:
+            # Now move remaining player bullets
             bullet.move_ip(0, -BULLET_SPEED)
-            if bullet.bottom < 0:
-                self.bullets.remove(bullet)
+            if bullet.bottom >= 0:
+                remaining.append(bullet)
+        self.bullets[:] = remaining
         # Move enemy bullets
-        for bullet in self.enemy_bullets[:]:
+        for bullet in self.enemy_bullets:
             bullet.move_ip(0, BULLET_SPEED)
-            if bullet.top > SCREEN_HEIGHT:
-                self.enemy_bullets.remove(bullet)
+        self.enemy_bullets[:] = [
+            bullet for bullet in self.enemy_bullets if bullet.top <= SCREEN_HEIGHT
+        ]
         # Enemy shooting timer
         self.enemy_shoot_cooldown -= dt
         # Player shooting cooldown timer
@@ -220,32 +239,37 @@ class SpaceInvadersState(Game):
             self.alien_direction *= -1
             for rect, color in self.aliens:
                 rect.move_ip(0, ALIEN_DESCEND)
-        # Bullet-alien collisions (player bullets vs aliens)
-        for bullet in self.bullets[:]:
-            hit_index = bullet.collidelist([a[0] for a in self.aliens])
+        # Bullet-alien collisions (player bullets vs aliens). The alien rects
+        # are gathered once per frame and kept in step with ``self.aliens``.
+        alien_rects = [rect for rect, _ in self.aliens]
+        alien_bounds = _bounds(alien_rects)
+        remaining = []
+        for bullet in self.bullets:
+            hit_index = _first_hit(bullet, alien_rects, alien_bounds)
             if hit_index != -1:
                 # Destroy alien and the bullet
                 self.aliens.pop(hit_index)
-                self.bullets.remove(bullet)
+                alien_rects.pop(hit_index)
                 audio.play_effect("space_invaders", "alien_hit.wav")
                 self.score += 10
                 continue
             # Player bullet vs shelter blocks
-            shelter_hit = bullet.collidelist(self.shelters)
+            shelter_hit = _first_hit(bullet, self.shelters, shelter_bounds)
             if shelter_hit != -1:
                 # Destroy the shelter block and the bullet
                 self.shelters.pop(shelter_hit)
-                self.bullets.remove(bullet)
                 # No score change – shelters are neutral objects
                 continue
+            remaining.append(bullet)
+        self.bullets[:] = remaining
         # Enemy bullet-player collisions (with shelter blocks)
-        for bullet in self.enemy_bullets[:]:
+        remaining = []
+        for i, bullet in enumerate(self.enemy_bullets):
             # Check collision with shelter blocks first
-            hit_idx = bullet.collidelist(self.shelters)
+            hit_idx = _first_hit(bullet, self.shelters, shelter_bounds)
             if hit_idx != -1:
                 # Bullet hits a shelter block, remove the block and the bullet
                 self.shelters.pop(hit_idx)
-                self.enemy_bullets.remove(bullet)
                 audio.play_effect("space_invaders", "cover.wav")
                 continue
             if bullet.colliderect(self.player):
@@ -253,8 +277,11 @@ class SpaceInvadersState(Game):
                 audio.play_effect("space_invaders", "player_hit.wav")
                 self.game_over = True
                 audio.play_effect("space_invaders", "game_over.wav")
-                self.enemy_bullets.remove(bullet)
+                # Bullets after the fatal one are left untouched
+                remaining.extend(self.enemy_bullets[i + 1 :])
                 break
+            remaining.append(bullet)
+        self.enemy_bullets[:] = remaining
         # Check win
         if not self.aliens:
             self.win = True
@@ -324,6 +351,24 @@ class SpaceInvadersState(Game):
         self.draw_mute_overlay(screen)
 
 
+def _bounds(rects: List[pygame.Rect]) -> Optional[pygame.Rect]:
+    """Return the rect enclosing all of *rects*, or ``None`` if there are none."""
+    return rects[0].unionall(rects) if rects else None
+
+
+def _first_hit(
+    rect: pygame.Rect, rects: List[pygame.Rect], bounds: Optional[pygame.Rect]
+) -> int:
+    """Return ``rect.collidelist(rects)``, skipping the scan when *rect* misses *bounds*.
+
+    Bullets spend most frames in the empty space between the alien formation
+    and the shelters, so the single bounding-box test usually decides.
+    """
+    if bounds is None or not rect.colliderect(bounds):
+        return -1
+    return rect.collidelist(rects)
+
+
 def create_aliens() -> List[Tuple[pygame.Rect, Tuple[int, int, int]]]:
     """Create and return a list of alien (rect, color) tuples."""
     aliens = []
@@ -336,7 +381,7 @@ def create_aliens() -> List[Tuple[pygame.Rect, Tuple[int, int, int]]]:
             x = start_x + col * (ALIEN_WIDTH + ALIEN_H_SPACING)
             y = start_y + row * (ALIEN_HEIGHT + ALIEN_V_SPACING)
             rect = pygame.Rect(x, y, ALIEN_WIDTH, ALIEN_HEIGHT)
-            color = random.choice([RED, GREEN, BLUE, YELLOW])
+            color = random.choice(ALIEN_COLORS)
             aliens.append((rect, color))
     return aliens
 
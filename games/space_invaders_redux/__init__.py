@@ -26,6 +26,9 @@ from games.run_helper import run_game
 from .alien_loader import get_mod_loader, load_alien_types
 from .space_invaders_redux import SpaceInvadersReduxState
 
+# Primary state class; lets menu discovery identify this package as a game.
+STATE_CLASS = SpaceInvadersReduxState
+
 __all__ = [
     "SpaceInvadersReduxState",
     "run",
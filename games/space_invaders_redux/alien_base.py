@@ -7,6 +7,7 @@ allowing mods to customize parameters and behavior through inheritance.
 
 import abc
 import random
+from typing import Tuple
 
 import pygame
 
@@ -54,6 +55,9 @@ class AlienBase(abc.ABC):
         self.bullet_width = self.DEFAULT_BULLET_WIDTH
         self.bullet_height = self.DEFAULT_BULLET_HEIGHT
         self.direction = 1  # 1 = right, -1 = left
+        # Eye rects as (dx, dy, w, h) offsets from the top-left corner; see
+        # ``_set_eyes``. The alien's size never changes, so they are fixed.
+        self._eye_offsets: Tuple[Tuple[int, int, int, int], ...] = ()
 
     @abc.abstractmethod
     def move(self, dt: float, direction: int) -> None:
@@ -101,6 +105,34 @@ class AlienBase(abc.ABC):
         bullet_y = self.rect.bottom
         return pygame.Rect(bullet_x, bullet_y, self.bullet_width, self.bullet_height)
 
+    def _set_eyes(self, inset: int, top: int, eye_width: int, eye_height: int) -> None:
+        """Place two eyes *inset* pixels in from each side, *top* pixels down.
+
+        Args:
+            inset: Horizontal distance from each side edge to the nearest eye
+            top: Vertical distance from the top edge to the eyes
+            eye_width: Width of each eye in pixels
+            eye_height: Height of each eye in pixels
+        """
+        right = self.rect.width - inset - eye_width
+        self._eye_offsets = (
+            (inset, top, eye_width, eye_height),
+            (right, top, eye_width, eye_height),
+        )
+
+    def _draw_eyes(
+        self, screen: pygame.Surface, color: Tuple[int, int, int] = (0, 0, 0)
+    ) -> None:
+        """Draw the eyes set by ``_set_eyes`` at the alien's current position.
+
+        Args:
+            screen: Pygame surface to draw to
+            color: RGB color of the eyes
+        """
+        x, y = self.rect.topleft
+        for dx, dy, w, h in self._eye_offsets:
+            pygame.draw.rect(screen, color, (x + dx, y + dy, w, h))
+
     def get_color(self) -> tuple[int, int, int]:
         """Get the alien's color.
 
@@ -41,6 +41,16 @@ from .level_loader import LevelLoader
 
 logger = logging.getLogger(__name__)
 
+# Short effects played by this game; preloaded by ``audio.start_preload``.
+SOUND_EFFECTS = (
+    "shoot.wav",
+    "enemy_shoot.wav",
+    "alien_hit.wav",
+    "player_hit.wav",
+    "game_over.wav",
+)
+audio.register_effects("space_invaders_redux", SOUND_EFFECTS)
+
 # Game constants
 PLAYER_WIDTH = 50
 PLAYER_HEIGHT = 30
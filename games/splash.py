@@ -5,13 +5,14 @@ Displays a simple title with a fade‑in effect, holds briefly, then transitions
 """
 
 import os
+from typing import Optional
 
 import pygame
 
 from classic_arcade.config import BLACK, SCREEN_HEIGHT, SCREEN_WIDTH, WHITE
 from classic_arcade.engine import MenuState, State
 from classic_arcade.menu_items import get_menu_items
-from classic_arcade.utils import resolve_asset_path
+from classic_arcade.utils import get_font, resolve_asset_path
 
 
 class SplashState(State):
@@ -28,17 +29,27 @@ class SplashState(State):
         super().__init__()
         self.elapsed: float = 0.0
         self.alpha: int = 0  # 0‑255 opacity of the title text
+        # Fonts and images are loaded by ``_lazy_init`` on the first ``update`` so
+        # the window can appear before any asset decoding happens. Until then
+        # ``draw`` shows a plain bar as a loading placeholder.
+        self._assets_loaded = False
+        self._placeholder_surface = pygame.Surface((160, 4))
+        self._placeholder_surface.fill((220, 220, 220))
+        self._text_surface: Optional[pygame.Surface] = None
+        self._text_rect: Optional[pygame.Rect] = None
+        self._icon_surface: Optional[pygame.Surface] = None
+        self._icon_rect: Optional[pygame.Rect] = None
+        self._loading_surface: Optional[pygame.Surface] = None
+
+    def _lazy_init(self) -> None:
+        """Load the splash font, title text and icon (runs once)."""
+        self._assets_loaded = True
         # Prepare a font for the splash title – size chosen to be readable
-        # Ensure the font module is initialized before creating a Font object
-        pygame.font.init()
-        self._font = pygame.font.Font(None, 52)
-        # Pre‑render the text surface (without alpha) – we will apply alpha each frame
-        self._text_surface = self._font.render("Classic Arcade", True, WHITE)
-        self._text_rect = self._text_surface.get_rect(
+        text_surface = get_font(52).render("Classic Arcade", True, WHITE)
+        self._text_surface = text_surface
+        self._text_rect = text_surface.get_rect(
             center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 80)
         )
-        self._icon_surface = None
-        self._icon_rect = None
         icon_path = resolve_asset_path("assets/icons/default_game_icon.png")
         if icon_path:
             try:
@@ -51,10 +62,8 @@ class SplashState(State):
             except Exception:
                 self._icon_surface = None
                 self._icon_rect = None
-        self._loading_surface = None
         try:
-            loading_font = pygame.font.Font(None, 28)
-            self._loading_surface = loading_font.render(
+            self._loading_surface = get_font(28).render(
                 "Loading...", True, (220, 220, 220)
             )
         except Exception:
@@ -73,6 +82,8 @@ class SplashState(State):
 
         ``dt`` – time delta in seconds since the last frame.
         """
+        if not self._assets_loaded:
+            self._lazy_init()
         self.elapsed += dt
         # Fade‑in phase
         if self.elapsed < self.FADE_DURATION:
@@ -92,6 +103,14 @@ class SplashState(State):
         The background is black; the title text fades in using the current ``alpha`` value.
         """
         screen.fill(BLACK)
+        if self._text_surface is None or self._text_rect is None:
+            screen.blit(
+                self._placeholder_surface,
+                self._placeholder_surface.get_rect(
+                    center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 140)
+                ),
+            )
+            return
         # Apply current alpha to the pre‑rendered text surface
         text_surface = self._text_surface.copy()
         text_surface.set_alpha(self.alpha)
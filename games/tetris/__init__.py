@@ -15,6 +15,9 @@ from .tetris import (
     TetrisState,
 )
 
+# Primary state class; lets menu discovery identify this package as a game.
+STATE_CLASS = TetrisState
+
 __all__ = ["TetrisState", "Tetris2PlayerState", "TetrisModeSelectState", "run"]
 
 
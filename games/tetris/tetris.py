@@ -41,12 +41,16 @@ from classic_arcade.config import (
 from classic_arcade.constants import COUNTDOWN_SECONDS
 from classic_arcade.difficulty import apply_difficulty_divisor
 from classic_arcade.engine import State
-from classic_arcade.utils import draw_text
+from classic_arcade.utils import draw_text, draw_texts
 from games.game_base import Game
 from games.highscore import draw_highscore_screen, record_highscore
 
 logger = logging.getLogger(__name__)
 
+# Short effects played by this game; preloaded by ``audio.start_preload``.
+SOUND_EFFECTS = ("rotate.wav", "place.wav", "line_clear.wav")
+audio.register_effects("tetris", SOUND_EFFECTS)
+
 # Base speed values for difficulty scaling (default values)
 BASE_FALL_SPEED = 500
 BASE_FAST_FALL_SPEED = 50
@@ -617,32 +621,34 @@ class Tetris2PlayerState(Game):
                 if self.score1 > self.score2
                 else ("Player 2" if self.score2 > self.score1 else "Tie")
             )
-            draw_text(
+            draw_texts(
                 screen,
-                f"{winner} wins!",
-                FONT_SIZE_LARGE,
-                YELLOW,
-                SCREEN_WIDTH // 2,
-                SCREEN_HEIGHT // 2 - 50,
-                center=True,
-            )
-            draw_text(
-                screen,
-                f"P1: {self.score1}  -  P2: {self.score2}",
-                FONT_SIZE_MEDIUM,
-                WHITE,
-                SCREEN_WIDTH // 2,
-                SCREEN_HEIGHT // 2,
-                center=True,
-            )
-            draw_text(
-                screen,
-                "Press R to restart or ESC to menu",
-                FONT_SIZE_MEDIUM,
-                CYAN,
-                SCREEN_WIDTH // 2,
-                SCREEN_HEIGHT - 50,
-                center=True,
+                (
+                    (
+                        f"{winner} wins!",
+                        FONT_SIZE_LARGE,
+                        YELLOW,
+                        SCREEN_WIDTH // 2,
+                        SCREEN_HEIGHT // 2 - 50,
+                        True,
+                    ),
+                    (
+                        f"P1: {self.score1}  -  P2: {self.score2}",
+                        FONT_SIZE_MEDIUM,
+                        WHITE,
+                        SCREEN_WIDTH // 2,
+                        SCREEN_HEIGHT // 2,
+                        True,
+                    ),
+                    (
+                        "Press R to restart or ESC to menu",
+                        FONT_SIZE_MEDIUM,
+                        CYAN,
+                        SCREEN_WIDTH // 2,
+                        SCREEN_HEIGHT - 50,
+                        True,
+                    ),
+                ),
             )
         elif self.paused:
             self.draw_pause_overlay(screen)
@@ -766,30 +772,27 @@ class TetrisModeSelectState(State):
         """Render mode selection screen."""
         screen.fill(BLACK)
 
-        # Draw title
-        draw_text(
-            screen,
-            "Select Tetris Mode",
-            self.title_font_size,
-            WHITE,
-            SCREEN_WIDTH // 2,
-            SCREEN_HEIGHT // 3,
-            center=True,
-        )
-
-        # Draw options
-        for i, option in enumerate(self.options):
-            if i == self.selected:
-                text_color = GREEN
-            else:
-                text_color = WHITE
-
-            draw_text(
-                screen,
-                option,
-                self.item_font_size,
-                text_color,
+        # Title followed by the options, drawn in a single batch
+        labels = [
+            (
+                "Select Tetris Mode",
+                self.title_font_size,
+                WHITE,
                 SCREEN_WIDTH // 2,
-                SCREEN_HEIGHT // 2 + i * 50,
-                center=True,
+                SCREEN_HEIGHT // 3,
+                True,
+            )
+        ]
+        for i, option in enumerate(self.options):
+            text_color = GREEN if i == self.selected else WHITE
+            labels.append(
+                (
+                    option,
+                    self.item_font_size,
+                    text_color,
+                    SCREEN_WIDTH // 2,
+                    SCREEN_HEIGHT // 2 + i * 50,
+                    True,
+                )
             )
+        draw_texts(screen, labels)
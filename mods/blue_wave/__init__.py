@@ -19,6 +19,7 @@ class BlueWaveAlien(AlienBase):
     DEFAULT_SHOOT_CHANCE = 0.005  # 5x higher shooting rate
     DEFAULT_BULLET_SPEED = 6.0
     DEFAULT_COLOR = (0, 0, 255)  # Bright blue
+    _WAVE_COLOR = (1, 100, 255)  # Lighter blue
 
     def __init__(self, x: int, y: int, width: int, height: int):
         """Initialize a blue wave alien.
@@ -32,6 +33,7 @@ class BlueWaveAlien(AlienBase):
         super().__init__(x, y, width, height)
         # Randomize shooting chance slightly for variety
         self.shoot_chance = self.DEFAULT_SHOOT_CHANCE * random.uniform(0.8, 1.2)
+        self._set_eyes(5, 8, width // 6, height // 5)
 
     def move(self, dt: float, direction: int) -> None:
         """Move the alien horizontally with slight vertical drift.
@@ -61,7 +63,6 @@ class BlueWaveAlien(AlienBase):
         pygame.draw.rect(screen, self.color, self.rect)
 
         # Draw wave pattern on top
-        wave_color = (1.0, 100, 255)  # Lighter blue
         wave_width = self.rect.width // 3
         wave_height = self.rect.height // 4
 
@@ -69,27 +70,11 @@ class BlueWaveAlien(AlienBase):
             x = self.rect.x + i * wave_width + wave_width // 4
             y = self.rect.y + wave_height
             pygame.draw.ellipse(
-                screen, wave_color, (x, y, wave_width // 2, wave_height)
+                screen, self._WAVE_COLOR, (x, y, wave_width // 2, wave_height)
             )
 
         # Draw eyes
-        eye_color = (0, 0, 0)  # Black
-        eye_width = self.rect.width // 6
-        eye_height = self.rect.height // 5
-
-        pygame.draw.rect(
-            screen, eye_color, (self.rect.x + 5, self.rect.y + 8, eye_width, eye_height)
-        )
-        pygame.draw.rect(
-            screen,
-            eye_color,
-            (
-                self.rect.x + self.rect.width - 5 - eye_width,
-                self.rect.y + 8,
-                eye_width,
-                eye_height,
-            ),
-        )
+        self._draw_eyes(screen)
 
     def get_rect(self) -> pygame.Rect:
         """Return the alien's bounding rectangle.
@@ -25,6 +25,7 @@ class DefaultAlien(AlienBase):
             height: Height of the alien in pixels
         """
         super().__init__(x, y, width, height)
+        self._set_eyes(5, 5, width // 5, height // 6)
 
     def move(self, dt: float, direction: int) -> None:
         """Move the alien horizontally based on direction.
@@ -49,27 +50,7 @@ class DefaultAlien(AlienBase):
         pygame.draw.rect(screen, self.color, self.rect)
 
         # Draw simple eyes
-        eye_color = (0, 0, 0)  # Black
-        eye_width = self.rect.width // 5
-        eye_height = self.rect.height // 6
-
-        # Left eye
-        pygame.draw.rect(
-            screen,
-            eye_color,
-            (self.rect.x + 5, self.rect.y + 5, eye_width, eye_height),
-        )
-        # Right eye
-        pygame.draw.rect(
-            screen,
-            eye_color,
-            (
-                self.rect.x + self.rect.width - 5 - eye_width,
-                self.rect.y + 5,
-                eye_width,
-                eye_height,
-            ),
-        )
+        self._draw_eyes(screen)
 
     def get_rect(self) -> pygame.Rect:
         """Return the alien's bounding rectangle.
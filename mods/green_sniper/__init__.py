@@ -32,6 +32,7 @@ class GreenSniperAlien(AlienBase):
         self.original_width = width
         self.original_height = height
         super().__init__(x, y, width, height)
+        self._set_eyes(8, 10, width // 8, height // 6)
 
     def move(self, dt: float, direction: int) -> None:
         """Move the alien horizontally.
@@ -75,25 +76,7 @@ class GreenSniperAlien(AlienBase):
         pygame.draw.circle(screen, scope_color, (center_x, center_y), 3)
 
         # Draw eyes
-        eye_color = (0, 0, 0)  # Black
-        eye_width = self.rect.width // 8
-        eye_height = self.rect.height // 6
-
-        pygame.draw.rect(
-            screen,
-            eye_color,
-            (self.rect.x + 8, self.rect.y + 10, eye_width, eye_height),
-        )
-        pygame.draw.rect(
-            screen,
-            eye_color,
-            (
-                self.rect.x + self.rect.width - 8 - eye_width,
-                self.rect.y + 10,
-                eye_width,
-                eye_height,
-            ),
-        )
+        self._draw_eyes(screen)
 
     def get_rect(self) -> pygame.Rect:
         """Return the alien's bounding rectangle.
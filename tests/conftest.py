@@ -0,0 +1,74 @@
+"""Shared pytest fixtures for the test suite."""
+
+import os
+
+# Headless settings must be in place before pygame is first imported by any
+# test module; conftest is loaded before collection, so set them here.
+os.environ.setdefault("HEADLESS", "1")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _pygame():
+    """Initialise the pygame display and font modules once per test session.
+
+    The mixer is deliberately left uninitialised; audio tests start it lazily
+    when they need it.
+    """
+    pygame.display.init()
+    pygame.font.init()
+    yield
+    pygame.quit()
+
+
+@pytest.fixture(autouse=True)
+def _restore_pygame():
+    """Re-initialise pygame modules a test shut down with ``pygame.quit()``.
+
+    Tests share the session-wide initialisation above, so a test that quits
+    pygame (e.g. to check engine cleanup) must not leave it off for the next.
+    """
+    had_mixer = pygame.mixer.get_init() is not None
+    yield
+    if not pygame.display.get_init():
+        pygame.display.init()
+    if not pygame.font.get_init():
+        pygame.font.init()
+    if had_mixer and not pygame.mixer.get_init():
+        try:
+            pygame.mixer.init(frequency=22050, buffer=512)
+        except pygame.error:
+            pass
+
+
+@pytest.fixture(scope="session")
+def _screen_surface():
+    """Allocate one screen-sized surface for the whole session."""
+    from classic_arcade.config import SCREEN_HEIGHT, SCREEN_WIDTH
+
+    return pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+@pytest.fixture
+def surface(_screen_surface):
+    """Return the shared screen-sized surface, cleared to black."""
+    _screen_surface.fill((0, 0, 0))
+    return _screen_surface
+
+
+@pytest.fixture(scope="session")
+def mixer():
+    """Initialise ``pygame.mixer`` lazily, only for modules that request it.
+
+    Yields whether a mixer is available; machines without an audio device
+    still run the (mocked) audio tests.
+    """
+    if not pygame.mixer.get_init():
+        try:
+            pygame.mixer.init(frequency=22050, buffer=512)
+        except pygame.error:
+            pass
+    yield bool(pygame.mixer.get_init())
@@ -8,12 +8,16 @@ exceptions.
 import importlib
 
 import pygame
+import pytest
 
 import audio
 
 # Import the modules under test.
 from classic_arcade import config
 
+# Tests that change config globals or settings.json share one xdist worker.
+pytestmark = pytest.mark.xdist_group("config")
+
 
 def test_mute_default():
     """The global mute flag should default to ``False``."""
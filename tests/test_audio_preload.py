@@ -9,10 +9,14 @@ import os
 from unittest import mock
 
 import pygame
+import pytest
 
 import audio
 from classic_arcade import config
 
+# Only the audio tests start the mixer (see ``mixer`` in conftest).
+pytestmark = pytest.mark.usefixtures("mixer")
+
 
 def test_preload_effects(monkeypatch):
     """Calling ``preload_effects`` should load and cache the sound.
@@ -22,7 +26,7 @@ def test_preload_effects(monkeypatch):
     object and stores it in ``audio._SOUND_CACHE``.
     """
     # Ensure mute is off and mixer is considered initialised.
-    config.MUTE = False
+    monkeypatch.setattr(config, "MUTE", False)
     monkeypatch.setattr(pygame.mixer, "get_init", lambda: True)
 
     # Use a unique temporary filename.
@@ -37,12 +41,12 @@ def test_preload_effects(monkeypatch):
 
     # Mock pygame.mixer.Sound to capture instantiation.
     mock_sound = mock.Mock()
+    # Verify against the prefixed placeholder path (we no longer auto-create
+    # the concrete target file); resolve it once outside ``fake_sound``.
+    expected = os.path.abspath(audio._sound_path(f"placeholder_{filename}"))
 
     def fake_sound(path):
-        # Verify the path matches the expected placeholder path (we no longer
-        # auto-create the concrete target file; we load the prefixed placeholder).
-        expected = audio._sound_path(f"placeholder_{filename}")
-        assert os.path.abspath(path) == os.path.abspath(expected)
+        assert os.path.abspath(path) == expected
         return mock_sound
 
     monkeypatch.setattr(pygame.mixer, "Sound", fake_sound)
@@ -58,3 +62,55 @@ def test_preload_effects(monkeypatch):
     ph = audio._sound_path(f"placeholder_{filename}")
     if os.path.isfile(ph):
         os.remove(ph)
+
+
+def test_preload_effects_namespaces_game_sounds(monkeypatch):
+    """Game-specific sounds are cached per sub-folder so same-named files differ."""
+    monkeypatch.setattr(pygame.mixer, "get_init", lambda: True)
+    monkeypatch.setattr(audio, "_SOUND_CACHE", {})
+    monkeypatch.setattr(pygame.mixer, "Sound", lambda path: path)
+
+    audio.preload_effects(["shoot.wav"], sound_type="space_invaders")
+    audio.preload_effects(["shoot.wav"], sound_type="space_invaders_redux")
+
+    assert audio._SOUND_CACHE["space_invaders/shoot.wav"] != (
+        audio._SOUND_CACHE["space_invaders_redux/shoot.wav"]
+    )
+    assert "shoot.wav" not in audio._SOUND_CACHE
+
+
+@pytest.mark.parametrize("filenames", [["brick.wav", "bounce.wav", "shoot.wav"]])
+def test_preload_effects_batch(monkeypatch, filenames):
+    """A single ``preload_effects`` call caches every file in the batch."""
+    monkeypatch.setattr(config, "MUTE", False)
+    monkeypatch.setattr(pygame.mixer, "get_init", lambda: True)
+    monkeypatch.setattr(audio, "_SOUND_CACHE", {})
+    shared_sound = mock.Mock()
+    monkeypatch.setattr(pygame.mixer, "Sound", lambda path: shared_sound)
+
+    audio.preload_effects(filenames)
+
+    assert all(audio._SOUND_CACHE.get(name) is shared_sound for name in filenames)
+
+
+def test_background_preload_loads_existing_files_only(monkeypatch, tmp_path):
+    """The preload thread loads sounds on disk and never copies placeholders."""
+    sounds = tmp_path / "assets" / "sounds"
+    (sounds / "demo").mkdir(parents=True)
+    (sounds / "demo" / "present.wav").write_bytes(b"RIFF")
+    (sounds / "placeholder.wav").write_bytes(b"RIFF")
+    monkeypatch.setattr(audio, "_get_base_dir", lambda: str(tmp_path))
+    monkeypatch.setattr(audio, "_SOUND_CACHE", {})
+    monkeypatch.setattr(audio, "_GAME_EFFECTS", {})
+    monkeypatch.setattr(pygame.mixer, "get_init", lambda: True)
+    monkeypatch.setattr(pygame.mixer, "Sound", lambda path: path)
+
+    audio.register_effects("demo", ["present.wav", "missing.wav"])
+    audio.start_preload()
+    audio.stop_preload()
+
+    assert audio._PRELOAD_THREAD is None
+    assert audio._SOUND_CACHE == {
+        "demo/present.wav": str(sounds / "demo" / "present.wav")
+    }
+    assert sorted(os.listdir(sounds / "demo")) == ["present.wav"]
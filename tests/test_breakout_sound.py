@@ -1,16 +1,16 @@
+import collections
+
 import pygame
+import pytest
 
 import audio
 from games.breakout import BreakoutState
-from games.breakout.breakout import BALL_RADIUS, BALL_SPEED
-
 
-def _dummy_keys():
-    class DummyKeys(dict):
-        def __getitem__(self, key):
-            return False
+# Only the audio tests start the mixer (see ``mixer`` in conftest).
+pytestmark = pytest.mark.usefixtures("mixer")
 
-    return DummyKeys()
+# Stand-in for ``pygame.key.get_pressed()``: every key reads as not pressed.
+_DUMMY_KEYS = collections.defaultdict(bool)
 
 
 def test_brick_hit_plays_sound(monkeypatch):
@@ -31,16 +31,19 @@ def test_brick_hit_plays_sound(monkeypatch):
 
     monkeypatch.setattr(audio, "play_effect", fake_play_effect)
     # Mock pygame key presses to return no keys pressed
-    monkeypatch.setattr(pygame.key, "get_pressed", lambda: _dummy_keys())
+    monkeypatch.setattr(pygame.key, "get_pressed", lambda: _DUMMY_KEYS)
+    # Read ball constants at run time; difficulty tests re-apply them.
+    from games.breakout import breakout as _bk
+
     # Initialise game state
     state = BreakoutState()
     assert state.bricks, "No bricks present to test"
     # Position ball overlapping the first brick
     brick_rect, _ = state.bricks[0]
     state.ball = pygame.Rect(
-        brick_rect.x, brick_rect.y, BALL_RADIUS * 2, BALL_RADIUS * 2
+        brick_rect.x, brick_rect.y, _bk.BALL_RADIUS * 2, _bk.BALL_RADIUS * 2
     )
-    state.ball_vel = [BALL_SPEED, BALL_SPEED]
+    state.ball_vel = [_bk.BALL_SPEED, _bk.BALL_SPEED]
     # Run update to trigger collision
     state.update(0.016)
     # Verify sound effect called for brick hit
@@ -63,12 +66,16 @@ def test_paddle_collision_plays_sound(monkeypatch):
             pass
 
     monkeypatch.setattr(audio, "play_effect", fake_play_effect)
-    monkeypatch.setattr(pygame.key, "get_pressed", lambda: _dummy_keys())
+    monkeypatch.setattr(pygame.key, "get_pressed", lambda: _DUMMY_KEYS)
+    from games.breakout import breakout as _bk
+
     state = BreakoutState()
     # Position ball overlapping the paddle
     paddle = state.paddle
-    state.ball = pygame.Rect(paddle.x, paddle.y, BALL_RADIUS * 2, BALL_RADIUS * 2)
-    state.ball_vel = [0, BALL_SPEED]
+    state.ball = pygame.Rect(
+        paddle.x, paddle.y, _bk.BALL_RADIUS * 2, _bk.BALL_RADIUS * 2
+    )
+    state.ball_vel = [0, _bk.BALL_SPEED]
     # Run update to trigger paddle collision
     state.update(0.016)
     assert "bounce.wav" in calls, f"Expected 'bounce.wav' call, got {calls}"
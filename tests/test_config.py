@@ -4,15 +4,14 @@ Ensures difficulty multiplier, get/set difficulty functions work correctly.
 """
 
 import json
-import os
 
 import pytest
 
-# Ensure headless mode for pygame (if needed)
-os.environ["HEADLESS"] = "1"
-
 from classic_arcade import config
 
+# Tests that change config globals or settings.json share one xdist worker.
+pytestmark = pytest.mark.xdist_group("config")
+
 
 def test_difficulty_multiplier_values():
     # Easy
@@ -25,9 +24,24 @@ def test_difficulty_multiplier_values():
     assert config.difficulty_multiplier("unknown") == 1.5
 
 
-def test_get_set_difficulty_and_persistence(tmp_path, monkeypatch):
-    # Use a temporary directory for settings.json to avoid affecting repo
-    settings_path = tmp_path / "settings.json"
+@pytest.fixture(scope="module")
+def settings_path(tmp_path_factory):
+    """One temporary settings.json shared by the tests in this module.
+
+    Tests isolate themselves by changing different game keys.
+    """
+    return tmp_path_factory.mktemp("cfg") / "settings.json"
+
+
+def _read_settings(path):
+    """Return the parsed settings file, or an empty dict if it is missing."""
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_get_set_difficulty_and_persistence(settings_path, monkeypatch):
     # Monkeypatch the _SETTINGS_PATH in config to point to temporary file
     monkeypatch.setattr(config, "_SETTINGS_PATH", str(settings_path))
     # Ensure defaults are easy
@@ -35,6 +49,8 @@ def test_get_set_difficulty_and_persistence(tmp_path, monkeypatch):
     # Change difficulty for snake to hard
     config.set_difficulty("snake", config.DIFFICULTY_HARD)
     assert config.get_difficulty("snake") == config.DIFFICULTY_HARD
+    # Writes are debounced; flush so the file reflects the change now
+    config.flush_settings()
     # Verify that settings file was written and contains the new value
     with open(settings_path, "r", encoding="utf-8") as f:
         data = json.load(f)
@@ -48,3 +64,45 @@ def test_get_set_difficulty_and_persistence(tmp_path, monkeypatch):
     assert config.get_difficulty("breakout") == config.DIFFICULTY_EASY
     assert config.get_difficulty("space_invaders") == config.DIFFICULTY_EASY
     assert config.get_difficulty("tetris") == config.DIFFICULTY_EASY
+
+
+def test_set_difficulty_debounces_writes(settings_path, monkeypatch):
+    monkeypatch.setattr(config, "_SETTINGS_PATH", str(settings_path))
+    monkeypatch.setattr(config, "_SAVE_DELAY", 60.0)
+    original = config.get_difficulty("pong")
+    try:
+        config.set_difficulty("pong", config.DIFFICULTY_MEDIUM)
+        config.set_difficulty("pong", config.DIFFICULTY_HARD)
+        # Nothing is written until the delay elapses or a flush is forced
+        assert (
+            _read_settings(settings_path).get("pong_difficulty")
+            != config.DIFFICULTY_HARD
+        )
+        config.flush_settings()
+        assert _read_settings(settings_path)["pong_difficulty"] == (
+            config.DIFFICULTY_HARD
+        )
+        assert not settings_path.with_name("settings.json.tmp").exists()
+    finally:
+        config.PONG_DIFFICULTY = original
+        config.flush_settings()
+
+
+def test_save_settings_rate_limits_writes(settings_path, monkeypatch):
+    monkeypatch.setattr(config, "_SETTINGS_PATH", str(settings_path))
+    monkeypatch.setattr(config, "_SAVE_DELAY", 60.0)
+    original = config.BREAKOUT_DIFFICULTY
+    try:
+        config.save_settings(force=True)
+        config.BREAKOUT_DIFFICULTY = config.DIFFICULTY_HARD
+        # A second save inside the delay window is deferred ...
+        config.save_settings()
+        assert _read_settings(settings_path)["breakout_difficulty"] == original
+        # ... until flushed
+        config.flush_settings()
+        assert _read_settings(settings_path)["breakout_difficulty"] == (
+            config.DIFFICULTY_HARD
+        )
+    finally:
+        config.BREAKOUT_DIFFICULTY = original
+        config.flush_settings()
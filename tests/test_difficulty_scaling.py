@@ -8,28 +8,44 @@ global speed/parameter constants based on the difficulty setting stored in
 
 import importlib
 
+import pytest
+
 from classic_arcade import config
 
-# Helper to reset config difficulties to easy after each test
+# Tests that change config globals or settings.json share one xdist worker.
+pytestmark = pytest.mark.xdist_group("config")
 
+# Game modules are imported once; resetting only re-runs their scaling helpers.
+breakout = importlib.import_module("games.breakout.breakout")
+pong = importlib.import_module("games.pong.pong")
+si = importlib.import_module("games.space_invaders.space_invaders")
+tetris = importlib.import_module("games.tetris.tetris")
 
-def reset_difficulties():
-    config.SNAKE_DIFFICULTY = config.DIFFICULTY_EASY
-    config.PONG_DIFFICULTY = config.DIFFICULTY_EASY
-    config.BREAKOUT_DIFFICULTY = config.DIFFICULTY_EASY
-    config.SPACE_INVADERS_DIFFICULTY = config.DIFFICULTY_EASY
-    config.TETRIS_DIFFICULTY = config.DIFFICULTY_EASY
-    # Re‑apply defaults for each module (they read globals on import)
-    importlib.reload(importlib.import_module("games.breakout"))
-    importlib.reload(importlib.import_module("games.pong"))
-    importlib.reload(importlib.import_module("games.space_invaders"))
-    importlib.reload(importlib.import_module("games.tetris"))
 
+_DIFFICULTY_ATTRS = (
+    "SNAKE_DIFFICULTY",
+    "PONG_DIFFICULTY",
+    "BREAKOUT_DIFFICULTY",
+    "SPACE_INVADERS_DIFFICULTY",
+    "TETRIS_DIFFICULTY",
+)
+
+
+@pytest.fixture
+def isolated_difficulty():
+    """Restore config difficulties and each game's speed globals after a test."""
+    snapshot = {name: getattr(config, name) for name in _DIFFICULTY_ATTRS}
+    yield
+    for name, value in snapshot.items():
+        setattr(config, name, value)
+    breakout._apply_breakout_speed_settings()
+    pong._apply_pong_speed_settings()
+    si._apply_space_invaders_speed_settings()
+    tetris._apply_tetris_speed_settings()
 
-def test_breakout_scaling():
-    # Easy (default) – values should be base
-    breakout = importlib.import_module("games.breakout.breakout")
 
+def test_breakout_scaling(isolated_difficulty):
+    # Easy (default) – values should be base
     config.BREAKOUT_DIFFICULTY = config.DIFFICULTY_EASY
     breakout._apply_breakout_speed_settings()
     assert breakout.PADDLE_SPEED == 6
@@ -50,12 +66,8 @@ def test_breakout_scaling():
     assert breakout.BALL_SPEED == int(5 * 2)
     assert breakout.BRICK_ROWS == 7
 
-    reset_difficulties()
-
-
-def test_pong_scaling():
-    pong = importlib.import_module("games.pong.pong")
 
+def test_pong_scaling(isolated_difficulty):
     # Easy
     config.PONG_DIFFICULTY = config.DIFFICULTY_EASY
     pong._apply_pong_speed_settings()
@@ -80,12 +92,8 @@ def test_pong_scaling():
     assert pong.BALL_SPEED_Y == int(4 * 2)
     assert pong.AI_PADDLE_SPEED == int(5 * 1.5)
 
-    reset_difficulties()
-
-
-def test_space_invaders_scaling():
-    si = importlib.import_module("games.space_invaders.space_invaders")
 
+def test_space_invaders_scaling(isolated_difficulty):
     # Easy
     config.SPACE_INVADERS_DIFFICULTY = config.DIFFICULTY_EASY
     si._apply_space_invaders_speed_settings()
@@ -112,12 +120,8 @@ def test_space_invaders_scaling():
     assert si.ALIEN_SPEED == int(1 * mult)
     assert si.ENEMY_SHOOT_COOLDOWN == 2.0 / mult
 
-    reset_difficulties()
-
-
-def test_tetris_scaling():
-    tetris = importlib.import_module("games.tetris.tetris")
 
+def test_tetris_scaling(isolated_difficulty):
     # Easy
     config.TETRIS_DIFFICULTY = config.DIFFICULTY_EASY
     tetris._apply_tetris_speed_settings()
@@ -137,5 +141,3 @@ def test_tetris_scaling():
     mult = 2.0
     assert tetris.FALL_SPEED == int(500 / mult)
     assert tetris.FAST_FALL_SPEED == int(50 / mult)
-
-    reset_difficulties()
@@ -1,11 +1,18 @@
+import functools
 import importlib.util
 
 from classic_arcade.engine import State
 from classic_arcade.menu_items import discover_games
 
 
+@functools.lru_cache(maxsize=1)
+def _items():
+    """Run discovery once per session; tests that mutate ``games`` call it directly."""
+    return tuple(discover_games())
+
+
 def test_discover_includes_space_invaders():
-    items = discover_games()
+    items = _items()
     names = [name for name, _, _ in items]
     assert "Space Invaders" in names
 
@@ -33,7 +40,7 @@ def test_discover_ignores_non_game_modules(tmp_path, monkeypatch):
 
 def test_discover_finds_state_subclasses():
     """Verify that discover_games correctly identifies State subclasses."""
-    items = discover_games()
+    items = _items()
 
     # Build a mapping of display names to launch targets
     name_to_target = {
@@ -57,7 +64,7 @@ def test_discover_finds_state_subclasses():
 
 def test_discover_excludes_internal_modules():
     """Verify that internal modules without State subclasses are excluded."""
-    items = discover_games()
+    items = _items()
     names = [name for name, _, _ in items]
 
     # These modules should not appear in the menu
@@ -75,7 +82,7 @@ def test_discover_excludes_internal_modules():
 
 def test_discover_provides_run_launch_target():
     """Verify that games with run() functions get the run function as launch target."""
-    items = discover_games()
+    items = _items()
 
     # Check that all discovered games have a run function as launch target
     for name, launch_target, _ in items:
@@ -88,7 +95,7 @@ def test_discover_provides_run_launch_target():
 
 def test_discover_handles_missing_icons_gracefully():
     """Verify that discover_games handles modules without icons."""
-    items = discover_games()
+    items = _items()
 
     # All items should have a valid icon_path (None is valid if no icon exists)
     for name, _, icon_path in items:
@@ -96,3 +103,20 @@ def test_discover_handles_missing_icons_gracefully():
         assert icon_path is None or isinstance(
             icon_path, str
         ), f"Game '{name}' icon_path should be None or str, got {type(icon_path)}"
+
+
+def test_discover_skips_modules_without_state_class_marker(tmp_path, monkeypatch):
+    """Modules that do not declare ``STATE_CLASS`` are never imported."""
+    import sys
+
+    import games
+
+    (tmp_path / "undeclared_game.py").write_text(
+        "raise RuntimeError('module-level code must not run')\n"
+    )
+    monkeypatch.setattr(games, "__path__", [*games.__path__, str(tmp_path)])
+
+    items = discover_games()
+
+    assert "games.undeclared_game" not in sys.modules
+    assert "Undeclared Game" not in [name for name, _, _ in items]
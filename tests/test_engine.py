@@ -3,15 +3,8 @@
 Ensures that a state can request a transition and the Engine updates the current state accordingly.
 """
 
-import os
-
 import pygame
 
-# Ensure headless mode
-os.environ["HEADLESS"] = "1"
-
-pygame.init()
-
 from classic_arcade.engine import Engine, State
 
 
@@ -68,3 +61,13 @@ def test_engine_state_transition(tmp_path, monkeypatch):
     # Ensure DummyStateB update works without error
     engine.state.update(1 / 60)
     assert engine.state.updated
+
+
+def test_coalesce_toggle_events_drops_repeated_toggles():
+    from classic_arcade.engine import _coalesce_toggle_events
+
+    m = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_m)
+    p = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_p)
+    left = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_LEFT)
+    events = [m, left, m, p, left, p, m]
+    assert _coalesce_toggle_events(events) == [m, left, p, left]
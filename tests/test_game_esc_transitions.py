@@ -1,8 +1,8 @@
 import os
 import sys
-import unittest
 
 import pygame
+import pytest
 
 # Ensure the project root is on sys.path for imports
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -14,40 +14,27 @@ from games.snake import SnakeState
 from games.space_invaders import SpaceInvadersState
 from games.tetris import TetrisState
 
-
-class TestEscKeyTransitions(unittest.TestCase):
-    def setUp(self):
-        pygame.init()
-        # instantiate each state
-        self.snake = SnakeState()
-        self.pong = PongState()
-        self.breakout = BreakoutState()
-        self.space = SpaceInvadersState()
-        self.tetris = TetrisState()
-
-    def tearDown(self):
-        pygame.quit()
-
-    def assert_transition_to_menu(self, state):
-        esc_event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE)
-        state.handle_event(esc_event)
-        self.assertIsInstance(state.next_state, MenuState)
-
-    def test_snake_esc(self):
-        self.assert_transition_to_menu(self.snake)
-
-    def test_pong_esc(self):
-        self.assert_transition_to_menu(self.pong)
-
-    def test_breakout_esc(self):
-        self.assert_transition_to_menu(self.breakout)
-
-    def test_space_invaders_esc(self):
-        self.assert_transition_to_menu(self.space)
-
-    def test_tetris_esc(self):
-        self.assert_transition_to_menu(self.tetris)
-
-
-if __name__ == "__main__":
-    unittest.main()
+GAMES = ["snake", "pong", "breakout", "space_invaders", "tetris"]
+ESC_EVENT = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE)
+
+
+@pytest.fixture(scope="class")
+def states():
+    # pygame is initialised once per session by the conftest fixture;
+    # each state is built once and shared by every test in the class.
+    return {
+        "snake": SnakeState(),
+        "pong": PongState(),
+        "breakout": BreakoutState(),
+        "space_invaders": SpaceInvadersState(),
+        "tetris": TetrisState(),
+    }
+
+
+class TestEscKeyTransitions:
+    @pytest.mark.parametrize("key", GAMES)
+    def test_esc(self, states, key):
+        state = states[key]
+        state.next_state = None
+        state.handle_event(ESC_EVENT)
+        assert isinstance(state.next_state, MenuState)
@@ -4,14 +4,8 @@ Verifies that the help screen displays controls for all games
 and transitions correctly when pressing H or ESC.
 """
 
-import os
-
-os.environ["HEADLESS"] = "1"
-
 import pygame
 
-pygame.init()
-
 from classic_arcade.engine import Engine, HelpState, MenuState
 
 
@@ -68,13 +62,11 @@ def test_help_state_update_no_error():
     help_state.update(1.0 / 60)
 
 
-def test_help_state_draw_no_error():
+def test_help_state_draw_no_error(surface):
     """Test that HelpState.draw() runs without errors."""
     help_state = HelpState()
-    # Create a dummy surface for drawing
-    screen = pygame.Surface((640, 480))
     # Should not raise any exception
-    help_state.draw(screen)
+    help_state.draw(surface)
 
 
 def test_help_state_get_all_controls():
@@ -94,6 +86,27 @@ def test_help_state_get_all_controls():
         assert len(control_lines) >= 1
 
 
+def test_help_state_controls_are_cached():
+    """Test that controls are collected once and shared between HelpState instances."""
+    first = HelpState()._get_all_controls()
+    assert HelpState()._get_all_controls() is first
+
+
+def test_help_state_has_no_instance_dict():
+    """HelpState declares ``__slots__`` all the way up its State base."""
+    assert not hasattr(HelpState(), "__dict__")
+
+
+def test_help_state_sections_are_prerendered():
+    """Test that each game's controls are rendered once into a single surface."""
+    help_state = HelpState()
+    sections = help_state._get_sections()
+    assert len(sections) == len(help_state._get_all_controls())
+    assert HelpState()._get_sections() is sections
+    total = help_state.margin_top + sum(advance for _, _, advance in sections)
+    assert total == help_state._calculate_content_height(help_state._get_all_controls())
+
+
 def test_snake_get_controls():
     """Test that SnakeState has get_controls() method."""
     from games.snake.snake import SnakeState
@@ -1,7 +1,6 @@
 import json
 import os
 
-import pygame
 import pytest
 
 # Import the highscore module
@@ -13,9 +12,15 @@ def reset_hs_dir(tmp_path, monkeypatch):
     """Ensure the highscore directory is isolated per test."""
     # Monkeypatch the _HIGHSCORE_DIR to the temporary path
     monkeypatch.setattr(hs, "_HIGHSCORE_DIR", str(tmp_path))
+    # Start each test with an empty score cache and no pending writes
+    monkeypatch.setattr(hs, "_CACHE", {})
+    monkeypatch.setattr(hs, "_DIRTY", set())
+    monkeypatch.setattr(hs, "_LAST_FLUSH", None)
+    monkeypatch.setattr(hs, "_PATHS", {})
     # Ensure directory exists
     os.makedirs(str(tmp_path), exist_ok=True)
     yield
+    hs._flush_all()
     # Cleanup: remove any created files
     for f in os.listdir(str(tmp_path)):
         os.remove(os.path.join(str(tmp_path), f))
@@ -46,6 +51,36 @@ def test_add_score_creates_and_sorts(tmp_path):
     assert [e["score"] for e in loaded] == [200, 150, 100]
 
 
+def test_add_score_keeps_ties_in_insertion_order():
+    first = hs.add_score("tiegame", 50)[0]
+    hs.add_score("tiegame", 80)
+    scores = hs.add_score("tiegame", 50)
+    assert [e["score"] for e in scores] == [80, 50, 50]
+    assert scores[1] is first
+
+
+def test_add_score_batches_writes(tmp_path, monkeypatch):
+    game_name = "batchgame"
+    file_path = os.path.join(str(tmp_path), f"highscore_{game_name}.json")
+    # The first score is written immediately
+    hs.add_score(game_name, 10)
+    with open(file_path, "r", encoding="utf-8") as f:
+        assert [e["score"] for e in json.load(f)] == [10]
+
+    # Within the flush interval further scores stay in memory only
+    monkeypatch.setattr(hs, "_FLUSH_INTERVAL", 3600.0)
+    hs.add_score(game_name, 30)
+    hs.add_score(game_name, 20)
+    with open(file_path, "r", encoding="utf-8") as f:
+        assert [e["score"] for e in json.load(f)] == [10]
+    assert [e["score"] for e in hs.load_highscores(game_name)] == [30, 20, 10]
+
+    # Flushing writes the pending changes in one go
+    hs._flush_all()
+    with open(file_path, "r", encoding="utf-8") as f:
+        assert [e["score"] for e in json.load(f)] == [30, 20, 10]
+
+
 def test_load_missing_returns_empty(tmp_path):
     # Load a game that has no file yet
     missing = hs.load_highscores("no_file_game")
@@ -65,8 +100,11 @@ def test_malformed_file_returns_empty(tmp_path, monkeypatch):
 
 def test_record_highscore_records_once(monkeypatch, tmp_path):
     class DummyState:
-        highscore_recorded = False
-        highscores = []
+        __slots__ = ("highscore_recorded", "highscores")
+
+        def __init__(self):
+            self.highscore_recorded = False
+            self.highscores = []
 
     state = DummyState()
     monkeypatch.setattr(hs, "_HIGHSCORE_DIR", str(tmp_path))
@@ -97,7 +135,7 @@ def test_load_logs_warning_on_corrupted_file(tmp_path, caplog):
     )
 
 
-def test_draw_highscore_handles_invalid_timestamp(tmp_path):
+def test_draw_highscore_handles_invalid_timestamp(tmp_path, surface):
     game_name = "badtimestamp"
     file_path = os.path.join(str(tmp_path), f"highscore_{game_name}.json")
     with open(file_path, "w", encoding="utf-8") as f:
@@ -105,9 +143,8 @@ def test_draw_highscore_handles_invalid_timestamp(tmp_path):
 
     scores = hs.load_highscores(game_name)
 
-    screen = pygame.Surface((800, 600))
     hs.draw_highscore_screen(
-        screen,
+        surface,
         scores,
         instruction_text="Press any key",
         instruction_color=(255, 255, 255),
@@ -115,3 +152,29 @@ def test_draw_highscore_handles_invalid_timestamp(tmp_path):
     )
 
     assert scores[0]["timestamp"] == "not-a-date"
+
+
+def test_failed_write_keeps_previous_file(tmp_path, monkeypatch):
+    # The new contents only replace the file once fully written
+    hs.save_highscores("atomic", [{"score": 1, "timestamp": "t"}])
+    file_path = os.path.join(str(tmp_path), "highscore_atomic.json")
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    with monkeypatch.context() as m:
+        m.setattr(hs.os, "replace", fail_replace)
+        with pytest.raises(OSError):
+            hs.save_highscores("atomic", [{"score": 2, "timestamp": "t"}])
+    with open(file_path, encoding="utf-8") as f:
+        assert json.load(f) == [{"score": 1, "timestamp": "t"}]
+    assert not os.path.exists(file_path + ".tmp")
+
+
+def test_file_path_is_cached_per_directory(tmp_path, monkeypatch):
+    first = hs._file_path("Pong")
+    assert first == os.path.join(str(tmp_path), "highscore_pong.json")
+    assert hs._file_path("Pong") is first
+    other = tmp_path / "other"
+    monkeypatch.setattr(hs, "_HIGHSCORE_DIR", str(other))
+    assert hs._file_path("Pong") == os.path.join(str(other), "highscore_pong.json")
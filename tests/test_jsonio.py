@@ -0,0 +1,41 @@
+import json
+import os
+
+import pytest
+
+from classic_arcade import jsonio
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_round_trips_with_and_without_orjson(monkeypatch, use_orjson):
+    if use_orjson and jsonio.orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(jsonio, "orjson", None)
+    entries = [{"score": 7, "timestamp": "2026-01-01T00:00:00"}]
+    raw = jsonio.dumps(entries)
+    assert isinstance(raw, bytes)
+    assert json.loads(raw) == entries
+    assert jsonio.loads(raw) == entries
+
+
+def test_atomic_write_bytes_replaces_file(tmp_path):
+    path = str(tmp_path / "data.json")
+    jsonio.atomic_write_bytes(path, b"old")
+    jsonio.atomic_write_bytes(path, b"new")
+    with open(path, "rb") as f:
+        assert f.read() == b"new"
+    assert not os.path.exists(path + ".tmp")
+
+
+def test_atomic_write_bytes_removes_temp_file_on_failure(tmp_path, monkeypatch):
+    path = str(tmp_path / "data.json")
+
+    def fail_write(fd, data):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(jsonio.os, "write", fail_write)
+    with pytest.raises(OSError):
+        jsonio.atomic_write_bytes(path, b"data")
+    assert not os.path.exists(path + ".tmp")
+    assert not os.path.exists(path)
@@ -1,42 +1,57 @@
-import unittest
+import pytest
 
-import pygame
-
-from classic_arcade.config import BLACK, GRAY, SCREEN_HEIGHT, SCREEN_WIDTH
+from classic_arcade import engine
+from classic_arcade.config import GRAY
 from classic_arcade.engine import MenuState
 from classic_arcade.menu_items import get_menu_items
 
 
-class TestMenuHighlight(unittest.TestCase):
-    def setUp(self):
-        pygame.init()
-        self.state = MenuState(get_menu_items())
-        self.surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        self.surface.fill(BLACK)
-
-    def tearDown(self):
-        pygame.quit()
-
-    def test_highlight_rect_and_animation(self):
-        # Initial draw should set highlight_rect and draw the rectangle
-        self.state.draw(self.surface)
-        self.assertIsNotNone(self.state.highlight_rect)
-        # Verify that the top-left pixel of the highlight rectangle is the highlight color
-        tl = self.state.highlight_rect.topleft
-        self.assertEqual(self.surface.get_at(tl)[:3], GRAY)
-
-        # Capture initial border width
-        initial_width = self.state.highlight_border_width
-        # Update animation phase
-        self.state.update(0.5)  # advance half a second
-        # Border width should change after update (pulsing effect)
-        self.assertNotEqual(self.state.highlight_border_width, initial_width)
-
-        # Draw again to apply new border width
-        self.state.draw(self.surface)
-        # Ensure highlight_rect remains set
-        self.assertIsNotNone(self.state.highlight_rect)
-
-
-if __name__ == "__main__":
-    unittest.main()
+@pytest.fixture
+def state():
+    return MenuState(get_menu_items())
+
+
+def test_highlight_rect_and_animation(state, surface):
+    # Initial draw should set highlight_rect and draw the rectangle
+    state.draw(surface)
+    assert state.highlight_rect is not None
+    # Verify that the top-left pixel of the highlight rectangle is the highlight color
+    tl = state.highlight_rect.topleft
+    assert surface.get_at(tl)[:3] == GRAY
+
+    # Capture initial border width
+    initial_width = state.highlight_border_width
+    # Update animation phase
+    state.update(0.5)  # advance half a second
+    # Border width should change after update (pulsing effect)
+    assert state.highlight_border_width != initial_width
+
+    # Draw again to apply new border width
+    state.draw(surface)
+    # Ensure highlight_rect remains set
+    assert state.highlight_rect is not None
+
+
+def test_highlight_border_surfaces_are_reused(state, surface):
+    state.draw(surface)
+    size = state.highlight_rect.size
+    border = engine._border_surface(size, 3, GRAY)
+    assert engine._border_surface(size, 3, GRAY) is border
+    assert border.get_at((0, 0))[:3] == GRAY
+    assert border.get_at((size[0] // 2, size[1] // 2)).a == 0
+    assert len(engine._BORDER_CACHE) <= engine._BORDER_CACHE_SIZE
+
+
+def test_static_menu_layer_reused_until_selection_changes(state, surface):
+    state.draw(surface)
+    layer = state._menu_layer
+    assert layer is not None
+    state.update(0.25)
+    state.draw(surface)
+    assert state._menu_layer is layer
+
+    state.selected = (state.selected + 1) % len(state.menu_items)
+    state.draw(surface)
+    assert state._menu_layer is not layer
+    tl = state.highlight_rect.topleft
+    assert surface.get_at(tl)[:3] == GRAY
@@ -113,3 +113,29 @@ def test_get_music_files_excludes_sound_effects():
         assert (
             "sound-effect" not in filename.lower()
         ), f"Sound effect file {filename} should not be in music files list"
+
+
+def test_get_music_files_cached_until_directory_changes(tmp_path, monkeypatch):
+    """get_music_files should reuse its scan until the directory mtime changes."""
+    (tmp_path / "theme.ogg").write_bytes(b"")
+    (tmp_path / "boom-sound-effect.wav").write_bytes(b"")
+    monkeypatch.setattr(audio, "_music_dir", lambda: str(tmp_path))
+    monkeypatch.setattr(audio, "_MUSIC_CACHE", None)
+
+    first = audio.get_music_files()
+    assert [os.path.basename(f) for f in first] == ["theme.ogg"]
+    assert audio._MUSIC_CACHE is not None
+
+    calls = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(
+        audio.os, "scandir", lambda p: calls.append(p) or real_scandir(p)
+    )
+    assert audio.get_music_files() == first
+    assert calls == []
+
+    (tmp_path / "extra.mp3").write_bytes(b"")
+    os.utime(tmp_path, (0, 12345))
+    names = sorted(os.path.basename(f) for f in audio.get_music_files())
+    assert names == ["extra.mp3", "theme.ogg"]
+    assert calls == [str(tmp_path)]
@@ -8,12 +8,8 @@ from games.pong import PongState
 
 class TestPongEscKey(unittest.TestCase):
     def setUp(self):
-        pygame.init()
         self.state = PongState()
 
-    def tearDown(self):
-        pygame.quit()
-
     def test_esc_key_transitions_to_menu(self):
         # Simulate ESC key press event
         esc_event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE)
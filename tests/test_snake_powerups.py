@@ -1,34 +1,24 @@
-import os
-
-os.environ["HEADLESS"] = "1"
-os.environ["SDL_VIDEODRIVER"] = "dummy"
-
 import random
 
-import pygame
-
-pygame.init()
-pygame.font.init()
-
-from classic_arcade.config import SCREEN_HEIGHT, SCREEN_WIDTH
 from games.snake import SnakeState
+from games.snake.snake import BLOCK_SIZE
 
 
-def test_powerup_spawn_and_collect():
+def test_powerup_spawn_and_collect(surface, monkeypatch):
     # Ensure determinism for random
     random.seed(42)
     s = SnakeState()
-    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-    # Simulate eating food multiple times to trigger spawn chance
+    # Force the 10% spawn roll to succeed so a single eat is enough
+    monkeypatch.setattr(random, "random", lambda: 0.0)
     initial_powerups = len(s.powerups)
-    for _ in range(50):
-        # place head on food to simulate eat
-        s.food = s.snake[0]
-        s.direction = (0, 0)
-        s.update(1.0 / 60.0)
-        s.draw(screen)
-    # At least one powerup should have spawned with this many eats and deterministic seed
-    assert len(s.powerups) >= initial_powerups
+    # Place food one block ahead and advance exactly one move to eat it
+    head_x, head_y = s.snake[0]
+    s.direction = (BLOCK_SIZE, 0)
+    s.food = (head_x + BLOCK_SIZE, head_y)
+    s.update(1.0 / s.snake_speed)
+    s.draw(surface)
+    assert s.score == 1
+    assert len(s.powerups) == initial_powerups + 1
 
 
 def test_powerup_effects_apply():
@@ -1,8 +1,7 @@
 import os
 import sys
-import unittest
 
-import pygame
+import pytest
 
 # Ensure project root is on sys.path for imports
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -11,27 +10,31 @@ from classic_arcade.engine import MenuState
 from games.splash import SplashState
 
 
-class TestSplashScreen(unittest.TestCase):
-    def setUp(self):
-        pygame.init()
-        self.state = SplashState()
-
-    def tearDown(self):
-        pygame.quit()
-
-    def test_fade_and_transition(self):
-        # Simulate updates before fade complete
-        self.state.update(0.5)  # half a second
-        self.assertTrue(0 < self.state.alpha < 255)
-        self.assertIsNone(self.state.next_state)
-        # Simulate updates to complete fade (another 0.6 seconds => total > 1.0)
-        self.state.update(0.6)
-        self.assertEqual(self.state.alpha, 255)
-        self.assertIsNone(self.state.next_state)
-        # Simulate hold duration (1.0 sec) + a bit more to trigger transition
-        self.state.update(1.1)
-        self.assertIsInstance(self.state.next_state, MenuState)
-
-
-if __name__ == "__main__":
-    unittest.main()
+@pytest.fixture
+def state():
+    return SplashState()
+
+
+def test_fade_and_transition(state):
+    # Simulate updates before fade complete
+    state.update(0.5)  # half a second
+    assert 0 < state.alpha < 255
+    assert state.next_state is None
+    # Simulate updates to complete fade (another 0.6 seconds => total > 1.0)
+    state.update(0.6)
+    assert state.alpha == 255
+    assert state.next_state is None
+    # Simulate hold duration (1.0 sec) + a bit more to trigger transition
+    state.update(1.1)
+    assert isinstance(state.next_state, MenuState)
+
+
+def test_assets_load_on_first_update(state, surface):
+    # Before the first update only the placeholder is drawn.
+    assert not state._assets_loaded
+    state.draw(surface)
+    assert state._text_surface is None
+    state.update(0.0)
+    assert state._assets_loaded
+    assert state._text_surface is not None
+    state.draw(surface)
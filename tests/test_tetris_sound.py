@@ -10,6 +10,8 @@ import audio
 from classic_arcade import config
 from games.tetris.tetris import GRID_HEIGHT, TetrisState
 
+ROTATE_EVENT = pygame.event.Event(pygame.KEYDOWN, key=config.KEY_UP)
+
 
 def test_rotate_plays_sound(monkeypatch):
     t = TetrisState()
@@ -33,8 +35,7 @@ def test_rotate_plays_sound(monkeypatch):
     monkeypatch.setattr(audio, "play_effect", fake_play)
 
     # Simulate pressing the rotate key
-    event = pygame.event.Event(pygame.KEYDOWN, key=config.KEY_UP)
-    t.handle_event(event)
+    t.handle_event(ROTATE_EVENT)
 
     assert calls == ["rotate.wav"]
 
@@ -125,7 +126,6 @@ def test_sounds_respect_mute(monkeypatch):
     # Mute should prevent playback
     config.MUTE = True
 
-    event = pygame.event.Event(pygame.KEYDOWN, key=config.KEY_UP)
-    t.handle_event(event)
+    t.handle_event(ROTATE_EVENT)
 
     assert called == []
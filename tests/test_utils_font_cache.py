@@ -0,0 +1,63 @@
+"""Tests for the shared font and text render caches in ``classic_arcade.utils``."""
+
+import pygame
+
+from classic_arcade.utils import draw_text, draw_texts, get_font, render_text
+
+
+def test_get_font_reuses_instances():
+    """Repeated requests for the same size return the same font object."""
+    assert get_font(24) is get_font(24)
+    assert get_font(24) is not get_font(32)
+
+
+def test_get_font_is_reset_by_pygame_quit():
+    """Fonts cached before ``pygame.quit()`` must not be reused afterwards."""
+    # Only the font module is restarted; ``_restore_pygame`` brings the
+    # display (and the mixer, if it was running) back after the test.
+    first = get_font(24)
+    pygame.quit()
+    pygame.font.init()
+    second = get_font(24)
+    assert second is not first
+    # Rendering with a stale font would crash; the fresh one must work.
+    assert second.render("ok", True, (255, 255, 255)).get_width() > 0
+    # The cache keeps working across repeated quit/init cycles.
+    pygame.quit()
+    pygame.font.init()
+    assert get_font(24) is not second
+
+
+def test_render_text_reuses_surfaces():
+    """Static labels are rendered once per text, size and colour."""
+    label = render_text("ESC to return", 24, (255, 255, 255))
+    assert render_text("ESC to return", 24, pygame.Color(255, 255, 255)) is label
+    assert render_text("ESC to return", 24, (255, 255, 255, 255)) is label
+    assert render_text("ESC to return", 24, (255, 255, 0)) is not label
+    assert label.get_width() > 0
+
+
+def test_draw_text_does_not_build_fonts_per_call(monkeypatch, surface):
+    """Both the plain and the wrapped path reuse the cached font."""
+    get_font(20)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("draw_text constructed a new Font")
+
+    monkeypatch.setattr(pygame.font, "Font", fail)
+    draw_text(surface, "Score: 10", 20, (255, 255, 255), 10, 10)
+    draw_text(surface, "a long line to wrap", 20, (255, 255, 255), 10, 40, max_width=60)
+
+
+def test_draw_texts_matches_draw_text(surface):
+    """Batched labels land exactly where individual ``draw_text`` calls do."""
+    labels = [
+        ("12", 36, (255, 255, 255), 160, 30, True),
+        ("Press R", 24, (0, 255, 255), 10, 400, False),
+    ]
+    draw_texts(surface, labels)
+    batched = pygame.image.tobytes(surface, "RGB")
+    surface.fill((0, 0, 0))
+    for text, size, color, x, y, center in labels:
+        draw_text(surface, text, size, color, x, y, center=center)
+    assert pygame.image.tobytes(surface, "RGB") == batched
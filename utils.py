@@ -1,130 +1,15 @@
-# utils.py
-"""Utility functions and constants for the Pygame arcade suite.
-Provides screen dimensions, color definitions, and a helper function for drawing text.
-"""
+"""Compatibility shim for classic_arcade.utils."""
 
-from typing import List, Tuple
+import sys as _sys
 
-import pygame
+from classic_arcade import utils as _utils
 
-from config import (
-    BLACK,
-    BLUE,
-    CYAN,
-    GRAY,
-    GREEN,
-    MAGENTA,
-    RED,
-    SCREEN_HEIGHT,
-    SCREEN_WIDTH,
-    WHITE,
-    YELLOW,
-)
+# Explicit re-exports so type checkers can resolve ``from utils import ...``.
+from classic_arcade.utils import draw_text as draw_text
+from classic_arcade.utils import draw_texts as draw_texts
+from classic_arcade.utils import get_font as get_font
+from classic_arcade.utils import render_text as render_text
+from classic_arcade.utils import resolve_asset_path as resolve_asset_path
+from classic_arcade.utils import wrap_text as wrap_text
 
-
-def wrap_text(
-    font: pygame.font.Font,
-    text: str,
-    max_width: int,
-    color: Tuple[int, int, int] = (255, 255, 255),
-) -> List[Tuple[pygame.Surface, int]]:
-    """Wrap text to fit within a maximum width.
-
-    Args:
-        font: Pygame font object.
-        text: Text to wrap.
-        max_width: Maximum line width in pixels.
-        color: RGB color tuple for the text.
-
-    Returns:
-        List of (surface, height) tuples for each line.
-    """
-    lines = text.split("\n")
-    result: List[Tuple[pygame.Surface, int]] = []
-
-    for line in lines:
-        words = line.split(" ")
-        current_line = ""
-        current_width = 0
-
-        for word in words:
-            word_surface = font.render(word + " ", True, color)
-            word_width = word_surface.get_width()
-
-            if current_width + word_width <= max_width or not current_line:
-                current_line += word + " "
-                current_width += word_width
-            else:
-                if current_line:
-                    surface = font.render(current_line.strip(), True, color)
-                    result.append((surface, font.get_height()))
-                current_line = word + " "
-                current_width = word_width
-
-        if current_line:
-            surface = font.render(current_line.strip(), True, color)
-            result.append((surface, font.get_height()))
-
-    return result
-
-
-def draw_text(
-    surface: pygame.Surface,
-    text: str,
-    size: int,
-    color: Tuple[int, int, int],
-    x: int,
-    y: int,
-    center: bool = True,
-    max_width: int | None = None,
-) -> int:
-    """Draw text on a surface.
-
-    Args:
-        surface: Surface to draw on.
-        text: Text to display.
-        size: Font size.
-        color: RGB color tuple.
-        x: X coordinate.
-        y: Y coordinate.
-        center: If True, (x, y) is the center of the text; otherwise top-left.
-        max_width: Maximum line width for wrapping (optional).
-
-    Returns:
-        Total height of rendered text in pixels.
-    """
-    if not pygame.font.get_init():
-        pygame.font.init()
-    font = pygame.font.Font(None, size)
-
-    if max_width:
-        lines = wrap_text(font, text, max_width, color)
-        total_height = sum(h for _, h in lines)
-
-        if center:
-            start_y = y - total_height // 2
-        else:
-            start_y = y
-
-        for i, (line_surface, line_height) in enumerate(lines):
-            line_rect = line_surface.get_rect()
-            if center:
-                line_rect.center = (x, start_y + i * line_height)
-            else:
-                line_rect.topleft = (x, start_y + i * line_height)
-            line_surface.fill(color, special_flags=pygame.BLEND_RGBA_MULT)
-            surface.blit(line_surface, line_rect)
-
-        return total_height
-    else:
-        text_surface = font.render(text, True, color)
-        text_rect = text_surface.get_rect()
-        if center:
-            text_rect.center = (x, y)
-        else:
-            text_rect.topleft = (x, y)
-        surface.blit(text_surface, text_rect)
-        return font.get_height()
-
-
-__all__ = ["draw_text", "wrap_text"]
+_sys.modules[__name__] = _utils